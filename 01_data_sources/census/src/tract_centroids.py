@@ -7,16 +7,19 @@ shapefiles that match the repository layout (see `census/input_data`).
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable, Optional, Sequence, Tuple
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 
 
 DEFAULT_YEAR = 2019
 INPUT_ROOT = Path(__file__).resolve().parents[1] / "input_data"
+CACHE_DIR = Path(__file__).resolve().parents[3] / "06_outputs" / "cache" / "census"
+CENTROID_DTYPE = np.float32
 ZIP_TEMPLATE = "tl_{year}_us_tract.zip"
 SHP_TEMPLATE = "tl_{year}_us_tract.shp"
 STATE_ZIP_TEMPLATE = "tl_{year}_{state}_tract.zip"
@@ -25,10 +28,68 @@ STATE_SHP_TEMPLATE = "tl_{year}_{state}_tract.shp"
 
 @dataclass(frozen=True)
 class TractData:
-    """Simple container bundling tract polygons and their centroids."""
+    """Simple container bundling tract polygons and their centroids.
+
+    ``centroid_lon``/``centroid_lat``/``centroid_geoid`` hold the centroid
+    coordinates and GEOIDs as plain arrays, extracted once so callers filtering
+    the same tracts for many storms stay out of geopandas (and avoid a per-row
+    GEOS lookup) each time.
+    """
 
     tracts: gpd.GeoDataFrame
     centroids: gpd.GeoDataFrame
+    centroid_lon: np.ndarray = field(init=False, repr=False)
+    centroid_lat: np.ndarray = field(init=False, repr=False)
+    centroid_geoid: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.centroids.empty:
+            lon = lat = np.empty(0, dtype=np.float64)
+        else:
+            lon = np.asarray(self.centroids.geometry.x, dtype=np.float64)
+            lat = np.asarray(self.centroids.geometry.y, dtype=np.float64)
+        if "GEOID" in self.centroids.columns:
+            geoid = self.centroids["GEOID"].to_numpy(dtype=object)
+        else:
+            geoid = np.empty(len(lon), dtype=object)
+        object.__setattr__(self, "centroid_lon", lon)
+        object.__setattr__(self, "centroid_lat", lat)
+        object.__setattr__(self, "centroid_geoid", geoid)
+
+    def bounds_mask(self, bounds: Tuple[float, float, float, float]) -> np.ndarray:
+        """Boolean mask of centroids inside ``(minx, miny, maxx, maxy)``."""
+
+        return _bounds_mask(self.centroid_lon, self.centroid_lat, bounds)
+
+
+@dataclass(frozen=True)
+class CentroidArrays:
+    """Tract centroid coordinates and GEOIDs without any geometry objects.
+
+    Exposes the same ``centroid_*`` arrays and ``bounds_mask`` as
+    :class:`TractData`, for batch jobs that only need centroid positions.
+    Coordinates are float32: ~1 m precision at these latitudes, half the
+    memory traffic of float64 in the distance kernels.
+    """
+
+    centroid_lon: np.ndarray
+    centroid_lat: np.ndarray
+    centroid_geoid: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.centroid_lon)
+
+    def bounds_mask(self, bounds: Tuple[float, float, float, float]) -> np.ndarray:
+        """Boolean mask of centroids inside ``(minx, miny, maxx, maxy)``."""
+
+        return _bounds_mask(self.centroid_lon, self.centroid_lat, bounds)
+
+
+def _bounds_mask(
+    lon: np.ndarray, lat: np.ndarray, bounds: Tuple[float, float, float, float]
+) -> np.ndarray:
+    minx, miny, maxx, maxy = bounds
+    return (lon >= minx) & (lat >= miny) & (lon <= maxx) & (lat <= maxy)
 
 
 def load_census_tracts(
@@ -131,6 +192,55 @@ def load_tracts_with_centroids(
     return TractData(tracts=tracts, centroids=centroids)
 
 
+def _source_archives(year: int, states: Optional[Sequence[str]]) -> list[Path]:
+    if states:
+        return [INPUT_ROOT / STATE_ZIP_TEMPLATE.format(year=year, state=state.strip()) for state in states]
+    return [INPUT_ROOT / ZIP_TEMPLATE.format(year=year)]
+
+
+def load_centroid_arrays(
+    year: int = DEFAULT_YEAR,
+    states: Optional[Sequence[str]] = None,
+    force_rebuild: bool = False,
+) -> CentroidArrays:
+    """Return tract centroid arrays, cached as ``.npz`` under ``06_outputs/cache``.
+
+    The first call for a given ``(year, states)`` loads the TIGER/Line archives
+    and computes centroids; later calls read the cached arrays directly. The
+    cache is rebuilt whenever a source archive is newer than it.
+    """
+
+    state_key = "-".join(sorted(state.strip() for state in states)) if states else "us"
+    cache_file = CACHE_DIR / f"tract_centroids_{year}_{state_key}.npz"
+
+    if not force_rebuild and cache_file.exists():
+        cache_mtime = cache_file.stat().st_mtime
+        sources = _source_archives(year, states)
+        if all(src.exists() and src.stat().st_mtime <= cache_mtime for src in sources):
+            with np.load(cache_file) as cached:
+                return CentroidArrays(
+                    centroid_lon=cached["lon"].astype(CENTROID_DTYPE, copy=False),
+                    centroid_lat=cached["lat"].astype(CENTROID_DTYPE, copy=False),
+                    centroid_geoid=cached["geoid"].astype(object),
+                )
+
+    tract_data = load_tracts_with_centroids(year=year, columns=["GEOID"], states=states)
+    arrays = CentroidArrays(
+        centroid_lon=tract_data.centroid_lon.astype(CENTROID_DTYPE),
+        centroid_lat=tract_data.centroid_lat.astype(CENTROID_DTYPE),
+        centroid_geoid=tract_data.centroid_geoid,
+    )
+
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(
+        cache_file,
+        lon=arrays.centroid_lon,
+        lat=arrays.centroid_lat,
+        geoid=arrays.centroid_geoid.astype(str),
+    )
+    return arrays
+
+
 def main() -> None:
     """CLI helper to preview tract counts and centroid sampling."""
 
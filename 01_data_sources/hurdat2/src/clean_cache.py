@@ -0,0 +1,47 @@
+"""
+Cached access to the cleaned HURDAT2 dataset.
+
+Parsing and cleaning the full Atlantic text file takes about a second per
+run. The cleaned frame is written once as Parquet, keyed on the source file's
+name and modification time, and later runs read that copy back instead.
+"""
+
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from parse_raw import parse_hurdat2_file
+from profile_clean import clean_hurdat2_data
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+CLEAN_CACHE_DIR = REPO_ROOT / "06_outputs" / "cache" / "hurdat2"
+
+
+def load_clean_hurdat2(hurdat_file, cache_dir=CLEAN_CACHE_DIR):
+    """
+    Load the cleaned HURDAT2 DataFrame, parsing the text file only on a cache miss
+
+    Args:
+        hurdat_file: Path to HURDAT2 text file
+        cache_dir: Directory holding the cached Parquet copies
+
+    Returns:
+        pandas.DataFrame: Cleaned hurricane data, as from clean_hurdat2_data
+    """
+    hurdat_file = Path(hurdat_file)
+    cache_file = Path(cache_dir) / f"{hurdat_file.stem}_clean_{hurdat_file.stat().st_mtime_ns}.parquet"
+    if cache_file.exists():
+        return pd.read_parquet(cache_file)
+
+    df_clean = clean_hurdat2_data(parse_hurdat2_file(str(hurdat_file)))
+    # Write to a per-process temp file and rename it into place, so parallel
+    # workers never read a half-written cache
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        df_clean.to_parquet(tmp_file, compression="zstd")
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)  # Read-only checkouts just re-parse next time
+    return df_clean
@@ -2,7 +2,6 @@
 Data cleaning and profiling functions for HURDAT2 hurricane data
 """
 
-import pandas as pd
 import numpy as np
 
 def clean_hurdat2_data(df):
@@ -70,59 +69,49 @@ def add_derived_fields(df):
         'Off-season'
     )
 
-    # Add movement speed (for consecutive points of same storm)
-    df['speed_kts'] = np.nan
-    df['direction_deg'] = np.nan
-
-    for storm_id in df['storm_id'].unique():
-        storm_mask = df['storm_id'] == storm_id
-        storm_data = df[storm_mask].sort_values('date')
-
-        if len(storm_data) > 1:
-            # Calculate movement between consecutive points
-            lats = storm_data['lat'].values
-            lons = storm_data['lon'].values
-            times = storm_data['date'].values
-
-            speeds = []
-            directions = []
-
-            for i in range(len(lats) - 1):
-                # Calculate distance and time difference
-                dist_nm = haversine_distance(lats[i], lons[i], lats[i+1], lons[i+1])
-                time_diff_hours = (pd.Timestamp(times[i+1]) - pd.Timestamp(times[i])).total_seconds() / 3600
-
-                if time_diff_hours > 0:
-                    speed = dist_nm / time_diff_hours  # knots
-                    direction = calculate_bearing(lats[i], lons[i], lats[i+1], lons[i+1])
-                else:
-                    speed = 0
-                    direction = 0
-
-                speeds.append(speed)
-                directions.append(direction)
-
-            # Assign speeds (first point gets NaN, rest get calculated values)
-            speeds.insert(0, np.nan)
-            directions.insert(0, np.nan)
-
-            df.loc[storm_mask, 'speed_kts'] = speeds
-            df.loc[storm_mask, 'direction_deg'] = directions
+    # Add movement speed (for consecutive points of same storm), computed for
+    # all consecutive pairs at once on the (storm_id, date) ordering
+    ordered = df[['storm_id', 'date', 'lat', 'lon']].reset_index(drop=True)
+    ordered = ordered.sort_values(['storm_id', 'date'], kind='stable')
+    storm_ids = ordered['storm_id'].to_numpy()
+    lats = ordered['lat'].to_numpy(dtype=float)
+    lons = ordered['lon'].to_numpy(dtype=float)
+    times = ordered['date'].to_numpy()
+
+    same_storm = storm_ids[1:] == storm_ids[:-1]
+    dist_nm = haversine_distance(lats[:-1], lons[:-1], lats[1:], lons[1:])
+    time_diff_hours = np.diff(times) / np.timedelta64(1, 'h')
+    moving = time_diff_hours > 0
+
+    # Stationary pairs get 0; the first point of each storm gets NaN
+    pair_speeds = np.where(moving, dist_nm / np.where(moving, time_diff_hours, 1.0), 0.0)  # knots
+    pair_directions = np.where(moving, calculate_bearing(lats[:-1], lons[:-1], lats[1:], lons[1:]), 0.0)
+
+    speeds = np.full(len(ordered), np.nan)
+    directions = np.full(len(ordered), np.nan)
+    speeds[1:] = np.where(same_storm, pair_speeds, np.nan)
+    directions[1:] = np.where(same_storm, pair_directions, np.nan)
+
+    # Scatter back from the sorted order to the frame's row order
+    positions = ordered.index.to_numpy()
+    df['speed_kts'] = speeds[np.argsort(positions)]
+    df['direction_deg'] = directions[np.argsort(positions)]
 
     return df
 
 def haversine_distance(lat1, lon1, lat2, lon2):
-    """Calculate distance between two points on Earth in nautical miles"""
-    from math import radians, cos, sin, asin, sqrt
+    """Calculate distance between two points on Earth in nautical miles
 
+    Accepts scalars or NumPy arrays (element-wise).
+    """
     # Convert to radians
-    lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
+    lat1, lon1, lat2, lon2 = map(np.radians, [lat1, lon1, lat2, lon2])
 
     # Haversine formula
     dlat = lat2 - lat1
     dlon = lon2 - lon1
-    a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-    c = 2 * asin(sqrt(a))
+    a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
+    c = 2 * np.arcsin(np.sqrt(a))
 
     # Earth's radius in nautical miles
     r_nm = 3440.065
@@ -130,18 +119,19 @@ def haversine_distance(lat1, lon1, lat2, lon2):
     return c * r_nm
 
 def calculate_bearing(lat1, lon1, lat2, lon2):
-    """Calculate bearing from point 1 to point 2 in degrees"""
-    from math import radians, degrees, cos, sin, atan2
+    """Calculate bearing from point 1 to point 2 in degrees
 
-    lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
+    Accepts scalars or NumPy arrays (element-wise).
+    """
+    lat1, lon1, lat2, lon2 = map(np.radians, [lat1, lon1, lat2, lon2])
 
     dlon = lon2 - lon1
 
-    y = sin(dlon) * cos(lat2)
-    x = cos(lat1) * sin(lat2) - sin(lat1) * cos(lat2) * cos(dlon)
+    y = np.sin(dlon) * np.cos(lat2)
+    x = np.cos(lat1) * np.sin(lat2) - np.sin(lat1) * np.cos(lat2) * np.cos(dlon)
 
-    bearing = atan2(y, x)
-    bearing = degrees(bearing)
+    bearing = np.arctan2(y, x)
+    bearing = np.degrees(bearing)
     bearing = (bearing + 360) % 360  # Normalize to 0-360
 
     return bearing
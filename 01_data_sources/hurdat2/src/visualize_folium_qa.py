@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
 
@@ -32,13 +33,33 @@ import sys
 from pathlib import Path
 REPO_ROOT = Path(__file__).resolve().parents[3]
 sys.path.insert(0, str(REPO_ROOT / "04_src_shared"))
-from geometry_utils import calculate_destination_point
+from geometry_utils import calculate_destination_point_vec
 
 
 QUADRANT_BEARINGS: Dict[str, float] = {"ne": 45.0, "se": 135.0, "sw": 225.0, "nw": 315.0}
 NM_TO_METERS = 1852.0
 
 
+# Bearing ranges for each quadrant (NE, SE, SW, NW going clockwise); NW wraps past 360°
+ARC_QUADRANTS: Tuple[str, ...] = ("ne", "se", "sw", "nw")
+QUADRANT_BEARING_RANGES: Dict[str, Tuple[float, float]] = {
+    "ne": (45.0, 135.0),
+    "se": (135.0, 225.0),
+    "sw": (225.0, 315.0),
+    "nw": (315.0, 405.0),
+}
+
+
+@lru_cache(maxsize=8)
+def _arc_bearings(num_points_per_arc: int) -> np.ndarray:
+    """Bearings sampled along the four quadrant arcs, concatenated in ``ARC_QUADRANTS`` order."""
+    bearings = np.concatenate([
+        np.linspace(*QUADRANT_BEARING_RANGES[quadrant], num_points_per_arc) for quadrant in ARC_QUADRANTS
+    ]) % 360
+    bearings.flags.writeable = False
+    return bearings
+
+
 def _valid_radii(values: Iterable[Optional[float]]) -> bool:
     for value in values:
         if value is None or pd.isna(value) or value <= 0:
@@ -70,29 +91,12 @@ def create_wind_arc_polygon(
     if not _valid_radii(radii_nm.values()):
         return None
 
-    # Define bearing ranges for each quadrant (NE, SE, SW, NW going clockwise)
-    quadrant_bearing_ranges = {
-        "ne": (45.0, 135.0),
-        "se": (135.0, 225.0),
-        "sw": (225.0, 315.0),
-        "nw": (315.0, 405.0),  # Wraps past 360°
-    }
-
-    vertices: List[Tuple[float, float]] = []
-
-    for quadrant in ("ne", "se", "sw", "nw"):
-        radius = float(radii_nm[quadrant])  # type: ignore[arg-type]
-        start_bearing, end_bearing = quadrant_bearing_ranges[quadrant]
-
-        # Sample points along the arc
-        bearings = np.linspace(start_bearing, end_bearing, num_points_per_arc)
-
-        for bearing in bearings:
-            bearing_normalized = bearing % 360  # Handle NW quadrant wrap
-            dest_lon, dest_lat = calculate_destination_point(
-                center_lat, center_lon, bearing_normalized, radius
-            )
-            vertices.append((dest_lat, dest_lon))
+    # All four arcs in one vectorised call: each radius is repeated across its
+    # quadrant's slice of the cached bearing table
+    bearings = _arc_bearings(num_points_per_arc)
+    radii = np.repeat([float(radii_nm[quadrant]) for quadrant in ARC_QUADRANTS], num_points_per_arc)  # type: ignore[arg-type]
+    dest_lons, dest_lats = calculate_destination_point_vec(center_lat, center_lon, bearings, radii)
+    vertices: List[Tuple[float, float]] = list(zip(dest_lats.tolist(), dest_lons.tolist()))
 
     return vertices
 
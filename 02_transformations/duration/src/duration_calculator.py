@@ -7,6 +7,7 @@ from typing import Dict, Iterable, List, Tuple
 
 import numpy as np
 import pandas as pd
+import shapely
 from shapely.geometry import Point, Polygon
 
 import sys
@@ -15,7 +16,29 @@ from pathlib import Path
 REPO_ROOT = Path(__file__).resolve().parents[3]
 sys.path.append(str(REPO_ROOT / "01_data_sources" / "hurdat2" / "src"))
 
-from envelope_algorithm import calculate_destination_point, generate_quadrant_arc_points
+from envelope_algorithm import (
+    QUADRANT_BEARING_RANGES,
+    calculate_destination_point,
+    generate_quadrant_arc_points,
+)
+
+EARTH_RADIUS_NM = 3440.065
+
+# Slack (nm) added to a timestep's largest wind radius before a centroid is ruled
+# out without building the polygon; covers the default buffer and chord effects.
+EXPOSURE_SEARCH_MARGIN_NM = 5.0
+
+DURATION_RADII_COLUMNS = ["wind_radii_64_ne", "wind_radii_64_se", "wind_radii_64_sw", "wind_radii_64_nw"]
+
+
+def _haversine_nm(lat1, lon1, lat2, lon2):
+    """Return great-circle distance in nautical miles (scalars or arrays)."""
+
+    lat1_rad, lon1_rad, lat2_rad, lon2_rad = map(np.radians, [lat1, lon1, lat2, lon2])
+    dlat = lat2_rad - lat1_rad
+    dlon = lon2_rad - lon1_rad
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(dlon / 2) ** 2
+    return EARTH_RADIUS_NM * 2 * np.arcsin(np.sqrt(a))
 
 
 def interpolate_track_temporal(track_df: pd.DataFrame, interval_minutes: int = 15) -> pd.DataFrame:
@@ -156,25 +179,106 @@ def create_instantaneous_wind_polygon(
     return polygon
 
 
+def create_instantaneous_wind_polygons(
+    lat: Iterable[float],
+    lon: Iterable[float],
+    wind_radii_ne: Iterable[float],
+    wind_radii_se: Iterable[float],
+    wind_radii_sw: Iterable[float],
+    wind_radii_nw: Iterable[float],
+    *,
+    buffer_deg: float = 0.02,
+    arc_points_per_quadrant: int = 30,
+) -> np.ndarray:
+    """Batched :func:`create_instantaneous_wind_polygon` over aligned arrays.
+
+    Rows with all four quadrants are built together: every arc vertex is
+    projected in one broadcast ``calculate_destination_point`` call into an
+    ``(N, V, 2)`` coordinate array handed to ``shapely.polygons``. Rows with
+    missing quadrants are rare and go through the scalar function.
+
+    Returns:
+        Object array of polygons aligned with the inputs; ``None`` where no
+        quadrant has a positive radius.
+    """
+
+    lats = np.asarray(lat, dtype=float)
+    lons = np.asarray(lon, dtype=float)
+    radii = np.column_stack([
+        np.asarray(values, dtype=float)
+        for values in (wind_radii_ne, wind_radii_se, wind_radii_sw, wind_radii_nw)
+    ])
+    polygons = np.full(len(lats), None, dtype=object)
+
+    full = (radii > 0).all(axis=1)
+    if full.any():
+        # Same vertex sequence as the scalar arc path: each quadrant's arc, with
+        # the first point of every later quadrant dropped where arcs meet
+        sample_count = max(2, int(arc_points_per_quadrant))
+        bearings = []
+        quadrant_of_vertex = []
+        for position, quad in enumerate(("ne", "se", "sw", "nw")):
+            start_bearing, end_bearing = QUADRANT_BEARING_RANGES[quad]
+            arc = np.linspace(start_bearing, end_bearing, sample_count, endpoint=True) % 360.0
+            if position:
+                arc = arc[1:]
+            bearings.append(arc)
+            quadrant_of_vertex.append(np.full(len(arc), position))
+        bearings = np.concatenate(bearings)
+        vertex_radii = radii[full][:, np.concatenate(quadrant_of_vertex)]
+
+        dest_lons, dest_lats = calculate_destination_point(
+            lats[full, None], lons[full, None], bearings[None, :], vertex_radii
+        )
+        built = shapely.polygons(np.stack([dest_lons, dest_lats], axis=-1))
+        invalid = ~shapely.is_valid(built)
+        built[invalid] = shapely.buffer(built[invalid], 0)
+        polygons[full] = built
+
+    for idx in np.flatnonzero(~full):
+        polygons[idx] = create_instantaneous_wind_polygon(
+            lats[idx],
+            lons[idx],
+            *radii[idx],
+            buffer_deg=buffer_deg,
+            arc_points_per_quadrant=arc_points_per_quadrant,
+        )
+
+    return polygons
+
+
 def check_centroid_exposure_over_time(centroid: Point, interpolated_track: pd.DataFrame) -> pd.DataFrame:
     """Determine centroid exposure timeline at interpolated timesteps."""
 
-    exposure_records: List[Dict] = []
+    if interpolated_track.empty:
+        return pd.DataFrame()
 
-    for _, row in interpolated_track.iterrows():
+    # Unpack the track columns once instead of building a pandas row per timestep
+    lats = interpolated_track["lat"].to_numpy(dtype=float)
+    lons = interpolated_track["lon"].to_numpy(dtype=float)
+    radii = interpolated_track.reindex(columns=DURATION_RADII_COLUMNS).to_numpy(dtype=float)
+
+    has_radius = radii > 0
+    reach_nm = np.where(has_radius, radii, -np.inf).max(axis=1)
+
+    # A centroid farther than the largest radius cannot be inside the polygon,
+    # so only build (and test) polygons for timesteps that could contain it.
+    distance_nm = _haversine_nm(lats, lons, centroid.y, centroid.x)
+    candidates = has_radius.any(axis=1) & (distance_nm <= reach_nm + EXPOSURE_SEARCH_MARGIN_NM)
+
+    is_inside = np.zeros(len(lats), dtype=bool)
+    for idx in np.flatnonzero(candidates):
         polygon = create_instantaneous_wind_polygon(
-            lat=row.get("lat"),
-            lon=row.get("lon"),
-            wind_radii_ne=row.get("wind_radii_64_ne"),
-            wind_radii_se=row.get("wind_radii_64_se"),
-            wind_radii_sw=row.get("wind_radii_64_sw"),
-            wind_radii_nw=row.get("wind_radii_64_nw"),
+            lat=lats[idx],
+            lon=lons[idx],
+            wind_radii_ne=radii[idx, 0],
+            wind_radii_se=radii[idx, 1],
+            wind_radii_sw=radii[idx, 2],
+            wind_radii_nw=radii[idx, 3],
         )
+        is_inside[idx] = polygon.contains(centroid) if polygon is not None else False
 
-        is_inside = polygon.contains(centroid) if polygon is not None else False
-        exposure_records.append({"date": row["date"], "is_inside": is_inside})
-
-    return pd.DataFrame(exposure_records)
+    return pd.DataFrame({"date": interpolated_track["date"].to_numpy(), "is_inside": is_inside})
 
 
 def calculate_duration_features(exposure_timeline: pd.DataFrame, interval_minutes: int = 15) -> Dict[str, object]:
@@ -251,27 +355,15 @@ def identify_incomplete_wind_radii_boundary(interpolated_track: pd.DataFrame) ->
     return result
 
 
-def calculate_duration_for_tract(
-    centroid: Point,
+def prepare_duration_track(
     track_df: pd.DataFrame,
     wind_threshold: str = "64kt",
     interval_minutes: int = 15,
-    envelope=None,
-    coverage=None,
-) -> Dict[str, object]:
-    """Main entry point for duration exposure features.
-
-    Args:
-        centroid: Tract centroid point
-        track_df: Hurricane track data
-        wind_threshold: Wind speed threshold (default "64kt")
-        interval_minutes: Temporal interpolation interval (default 15)
-        envelope: Optional alpha-shape envelope for edge interpolation fallback
-        coverage: Optional exact wind-coverage union polygon. When provided this
-            is used to validate whether interpolation is appropriate.
+) -> pd.DataFrame:
+    """Impute and temporally interpolate ``track_df`` for exposure checks.
 
-    Returns:
-        Dictionary with duration metrics
+    The result depends only on the storm, so callers processing many tracts can
+    build it once and pass it to :func:`calculate_duration_for_tract`.
     """
     from envelope_algorithm import impute_missing_wind_radii
 
@@ -301,7 +393,38 @@ def calculate_duration_for_tract(
 
     track_subset = track_imputed[["date", "lat", "lon", *rename_map.keys()]].rename(columns=rename_map)
 
-    interpolated = interpolate_track_temporal(track_subset, interval_minutes=interval_minutes)
+    return interpolate_track_temporal(track_subset, interval_minutes=interval_minutes)
+
+
+def calculate_duration_for_tract(
+    centroid: Point,
+    track_df: pd.DataFrame,
+    wind_threshold: str = "64kt",
+    interval_minutes: int = 15,
+    envelope=None,
+    coverage=None,
+    interpolated_track: pd.DataFrame | None = None,
+) -> Dict[str, object]:
+    """Main entry point for duration exposure features.
+
+    Args:
+        centroid: Tract centroid point
+        track_df: Hurricane track data
+        wind_threshold: Wind speed threshold (default "64kt")
+        interval_minutes: Temporal interpolation interval (default 15)
+        envelope: Optional alpha-shape envelope for edge interpolation fallback
+        coverage: Optional exact wind-coverage union polygon. When provided this
+            is used to validate whether interpolation is appropriate.
+        interpolated_track: Optional output of :func:`prepare_duration_track` for
+            ``track_df``; pass it when looping over tracts of the same storm.
+
+    Returns:
+        Dictionary with duration metrics
+    """
+    interpolated = interpolated_track
+    if interpolated is None:
+        interpolated = prepare_duration_track(track_df, wind_threshold, interval_minutes)
+
     exposure = check_centroid_exposure_over_time(centroid, interpolated)
     duration = calculate_duration_features(exposure, interval_minutes=interval_minutes)
 
@@ -9,6 +9,7 @@ intensified after passing the tract.
 """
 
 from typing import Dict, Optional
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
@@ -55,6 +56,43 @@ def find_category_threshold_time(
     return threshold_obs['date'].min()
 
 
+def _first_threshold_times(
+    track_df: pd.DataFrame,
+    thresholds: Dict[str, int] = CATEGORY_THRESHOLDS
+) -> Dict[str, Optional[pd.Timestamp]]:
+    """Resolve :func:`find_category_threshold_time` for several thresholds in one pass.
+
+    Compares the max_wind array against every threshold at once (an N x K mask)
+    and takes the first hit per column with ``argmax``.
+
+    Args:
+        track_df: Storm track DataFrame with 'date' and 'max_wind' columns
+        thresholds: Mapping of name to wind speed threshold in knots
+
+    Returns:
+        Dictionary mapping each name to the first timestamp when
+        max_wind >= threshold, or None if never reached
+    """
+
+    if track_df.empty:
+        return {name: None for name in thresholds}
+
+    dates = track_df['date'].to_numpy(dtype='datetime64[ns]')
+    order = np.argsort(dates, kind='stable')
+    dates = dates[order]
+    wind = track_df['max_wind'].to_numpy(dtype=float)[order]
+
+    mask = wind[:, None] >= np.array(list(thresholds.values()))[None, :]
+    first = mask.argmax(axis=0)
+    reached = mask.any(axis=0)
+    first_dates = dates[first]
+
+    return {
+        name: pd.Timestamp(first_dates[i]) if reached[i] else None
+        for i, name in enumerate(thresholds)
+    }
+
+
 def calculate_lead_times(
     track_df: pd.DataFrame,
     nearest_approach_time: pd.Timestamp
@@ -93,11 +131,9 @@ def calculate_lead_times(
     """
 
     lead_times = {}
+    threshold_times = _first_threshold_times(track_df)
 
-    for category, threshold_kt in CATEGORY_THRESHOLDS.items():
-        # Find when storm first reached this category
-        threshold_time = find_category_threshold_time(track_df, threshold_kt)
-
+    for category, threshold_time in threshold_times.items():
         if threshold_time is None:
             # Storm never reached this category
             lead_times[f'lead_time_{category}_hours'] = None
@@ -111,6 +147,41 @@ def calculate_lead_times(
     return lead_times
 
 
+def calculate_lead_times_for_tracts(
+    track_df: pd.DataFrame,
+    nearest_approach_times: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """Vectorised :func:`calculate_lead_times` for many tracts of one storm.
+
+    Category threshold times depend only on the track, so they are resolved once
+    and subtracted from every tract's closest-approach time in a single array
+    operation.
+
+    Args:
+        track_df: Storm track DataFrame with 'date' and 'max_wind' columns
+        nearest_approach_times: datetime64 array of closest-approach times, one per tract
+
+    Returns:
+        Dictionary mapping 'lead_time_{category}_hours' to a float array aligned
+        with ``nearest_approach_times``; NaN where the storm never reached the
+        category.
+    """
+
+    approach = np.asarray(nearest_approach_times, dtype='datetime64[ns]')
+    lead_times = {}
+
+    for category, threshold_time in _first_threshold_times(track_df).items():
+        column = f'lead_time_{category}_hours'
+
+        if threshold_time is None:
+            lead_times[column] = np.full(len(approach), np.nan)
+        else:
+            time_diff = approach - np.datetime64(threshold_time, 'ns')
+            lead_times[column] = time_diff / np.timedelta64(1, 'h')
+
+    return lead_times
+
+
 def validate_lead_times(lead_times: Dict[str, Optional[float]]) -> bool:
     """Validate lead time calculations for logical consistency.
 
@@ -16,12 +16,14 @@ sys.path.extend([
     str(REPO_ROOT / "01_data_sources" / "hurdat2" / "src"),
     str(REPO_ROOT / "02_transformations" / "wind_coverage_envelope" / "src"),
     str(REPO_ROOT / "02_transformations" / "duration" / "src"),
+    str(REPO_ROOT / "03_integration" / "src"),
 ])
 
 from parse_raw import parse_hurdat2_file
 from profile_clean import clean_hurdat2_data
 from envelope_algorithm import impute_missing_wind_radii
 from duration_calculator import interpolate_track_temporal, create_instantaneous_wind_polygon
+from feature_io import existing_storm_features, read_storm_features
 
 
 def create_wind_coverage_envelope(track: pd.DataFrame, wind_threshold: str = "64kt", interval_minutes: int = 15):
@@ -103,8 +105,12 @@ def create_lead_time_qaqc(
     track = cleaned[cleaned['storm_id'] == storm_id].sort_values('date').reset_index(drop=True)
 
     # Load feature data
-    features_path = REPO_ROOT / "06_outputs/ml_ready/al092021_features.csv"
-    features = pd.read_csv(features_path)
+    features_path = existing_storm_features(REPO_ROOT / "06_outputs" / "ml_ready", storm_id)
+    if features_path is None:
+        raise FileNotFoundError(f"No saved features for {storm_id} in 06_outputs/ml_ready")
+    lead_col = f'lead_time_{category}_hours'
+    wanted = ['tract_geoid', 'distance_km', 'max_wind_experienced_kt', 'centroid_lat', 'centroid_lon', lead_col]
+    features = read_storm_features(features_path, columns=wanted)
     features['tract_geoid'] = features['tract_geoid'].astype(str)
 
     # Create map
@@ -144,7 +150,6 @@ def create_lead_time_qaqc(
             return '#228b22'  # Forest green - long warning
 
     # Get lead time column
-    lead_col = f'lead_time_{category}_hours'
     if lead_col not in features.columns:
         raise ValueError(f"Column {lead_col} not found in features")
 
@@ -14,14 +14,21 @@ Usage example (once TIGER/Line data is available):
 from __future__ import annotations
 
 import argparse
+import hashlib
+import math
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Tuple
 
+import shapely
 from shapely.geometry import LineString, Point
 
+import geopandas as gpd
 import numpy as np
 import pandas as pd
+from scipy.spatial import cKDTree
 
 REPO_ROOT = Path(__file__).resolve().parents[3]
 sys.path.extend(
@@ -47,8 +54,9 @@ from envelope_algorithm import create_storm_envelope, impute_missing_wind_radii
 from wind_interpolation import calculate_max_wind_experienced
 from duration_calculator import (
     calculate_duration_for_tract,
+    prepare_duration_track,
     interpolate_track_temporal,
-    create_instantaneous_wind_polygon,
+    create_instantaneous_wind_polygons,
 )
 from lead_time_calculator import calculate_lead_times
 from tract_centroids import load_tracts_with_centroids
@@ -57,6 +65,19 @@ from tract_centroids import load_tracts_with_centroids
 EARTH_RADIUS_NM = 3440.065  # nautical miles
 EARTH_RADIUS_KM = 6371.0    # kilometres
 
+# Quadrant labels in wind-radii column order (ne, se, sw, nw)
+QUADRANTS = np.array(["ne", "se", "sw", "nw"])
+
+# Worker threads for the chunked wind-polygon union. GEOS releases the GIL while
+# unioning, so threads give real parallelism without pickling geometries.
+UNION_MAX_WORKERS = 4
+
+# Wind coverage envelopes shared by the feature and dashboard pipelines
+ENVELOPE_CACHE_DIR = REPO_ROOT / "06_outputs" / "cache" / "envelopes"
+
+# Equal-area projection (metres) used for planar distances, as for tract centroids
+PROJECTED_CRS = "EPSG:5070"  # NAD83 / Conus Albers
+
 
 def haversine_nm(lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
     """Return great-circle distance in nautical miles."""
@@ -72,6 +93,16 @@ def haversine_nm(lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.
     return EARTH_RADIUS_NM * c
 
 
+def centroid_to_track_km(points: gpd.GeoSeries, track_line: LineString) -> pd.Series:
+    """Distance in km from each point to the track, measured in ``PROJECTED_CRS``.
+
+    ``points`` must carry a CRS; ``track_line`` is taken to be in the same one.
+    """
+
+    track = gpd.GeoSeries([track_line], crs=points.crs).to_crs(PROJECTED_CRS).iloc[0]
+    return points.to_crs(PROJECTED_CRS).distance(track) / 1000.0
+
+
 def build_storm_track(df_clean: pd.DataFrame, storm_id: str) -> pd.DataFrame:
     """Filter cleaned dataframe to a single storm ordered by time."""
 
@@ -106,6 +137,54 @@ def quadrant_for_offset(lat_diff: float, lon_diff: float) -> str:
     return "nw"
 
 
+def _quadrant_indices(lat_diff: np.ndarray, lon_diff: np.ndarray) -> np.ndarray:
+    """Return positions in :data:`QUADRANTS` for arrays of offsets."""
+
+    north = np.asarray(lat_diff) >= 0
+    east = np.asarray(lon_diff) >= 0
+    return np.where(north, np.where(east, 0, 3), np.where(east, 1, 2))
+
+
+def quadrants_for_offsets(lat_diff: np.ndarray, lon_diff: np.ndarray) -> np.ndarray:
+    """Vectorised :func:`quadrant_for_offset` over arrays of offsets."""
+
+    return QUADRANTS[_quadrant_indices(lat_diff, lon_diff)]
+
+
+def _unit_vectors(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Return (N, 3) points on the unit sphere for lat/lon degrees."""
+
+    lat_rad, lon_rad = np.radians(lats), np.radians(lons)
+    cos_lat = np.cos(lat_rad)
+    return np.column_stack([cos_lat * np.cos(lon_rad), cos_lat * np.sin(lon_rad), np.sin(lat_rad)])
+
+
+def nearest_track_points(
+    tract_lats: np.ndarray,
+    tract_lons: np.ndarray,
+    track_lats: np.ndarray,
+    track_lons: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (index, distance_nm) of the nearest track fix for every tract.
+
+    Track fixes are indexed in a KD-tree on the unit sphere. Chord length grows
+    monotonically with great-circle distance, so the tree's nearest neighbour is
+    the haversine nearest; only that one distance is then evaluated exactly.
+    Float32 inputs stay float32; anything else is computed in float64.
+    """
+
+    dtype = np.result_type(np.asarray(tract_lats), np.float32)
+    tract_lats = np.asarray(tract_lats, dtype=dtype)
+    tract_lons = np.asarray(tract_lons, dtype=dtype)
+    track_lats = np.asarray(track_lats, dtype=dtype)
+    track_lons = np.asarray(track_lons, dtype=dtype)
+
+    tree = cKDTree(_unit_vectors(track_lats, track_lons))
+    _, min_idx = tree.query(_unit_vectors(tract_lats, tract_lons))
+    min_dist_nm = haversine_nm(tract_lats, tract_lons, track_lats[min_idx], track_lons[min_idx])
+    return min_idx, min_dist_nm
+
+
 def create_wind_coverage_envelope(track: pd.DataFrame, wind_threshold: str = "64kt", interval_minutes: int = 15):
     """Create envelope from union of actual wind polygons (more accurate than alpha shape).
 
@@ -141,26 +220,33 @@ def create_wind_coverage_envelope(track: pd.DataFrame, wind_threshold: str = "64
     # Interpolate track temporally
     interpolated = interpolate_track_temporal(track_subset, interval_minutes=interval_minutes)
 
-    # Create all instantaneous wind polygons (NO BUFFER for exact coverage)
-    wind_polygons = []
-    for _, row in interpolated.iterrows():
-        poly = create_instantaneous_wind_polygon(
-            lat=row['lat'],
-            lon=row['lon'],
-            wind_radii_ne=row[f'wind_radii_{prefix}_ne'],
-            wind_radii_se=row[f'wind_radii_{prefix}_se'],
-            wind_radii_sw=row[f'wind_radii_{prefix}_sw'],
-            wind_radii_nw=row[f'wind_radii_{prefix}_nw'],
-            buffer_deg=0.0,  # No buffer - exact wind radii coverage only
-        )
-        if poly and not poly.is_empty:
-            wind_polygons.append(poly)
+    # Create all instantaneous wind polygons (NO BUFFER for exact coverage).
+    # Steps with no positive radius in any quadrant (spin-up/decay) would yield no
+    # polygon, so they are masked out up front instead of calling into shapely.
+    lats = interpolated['lat'].to_numpy()
+    lons = interpolated['lon'].to_numpy()
+    radii = interpolated[[f'wind_radii_{prefix}_{q}' for q in ("ne", "se", "sw", "nw")]].to_numpy(dtype=float)
+    valid_mask = np.nansum(radii, axis=1) > 0
+
+    polygons = create_instantaneous_wind_polygons(
+        lats[valid_mask],
+        lons[valid_mask],
+        *radii[valid_mask].T,
+        buffer_deg=0.0,  # No buffer - exact wind radii coverage only
+    )
+    wind_polygons = [poly for poly in polygons if poly is not None and not poly.is_empty]
 
     if not wind_polygons:
         return None, LineString(list(zip(track['lon'], track['lat']))), interpolated
 
-    # Union all polygons to create coverage envelope
-    wind_coverage = unary_union(wind_polygons)
+    # Union all polygons to create coverage envelope. Polygons stay in time order so
+    # each chunk holds heavily overlapping neighbours; chunks are unioned on worker
+    # threads and the partial unions merged in a final pass.
+    chunk_size = max(1, math.ceil(len(wind_polygons) / UNION_MAX_WORKERS))
+    chunks = [wind_polygons[i:i + chunk_size] for i in range(0, len(wind_polygons), chunk_size)]
+    with ThreadPoolExecutor(max_workers=min(UNION_MAX_WORKERS, len(chunks))) as executor:
+        chunk_unions = list(executor.map(unary_union, chunks))
+    wind_coverage = unary_union(chunk_unions)
 
     # Create track line
     track_line = LineString(list(zip(track['lon'], track['lat'])))
@@ -168,6 +254,46 @@ def create_wind_coverage_envelope(track: pd.DataFrame, wind_threshold: str = "64
     return wind_coverage, track_line, interpolated
 
 
+def load_wind_coverage_envelope(
+    track: pd.DataFrame,
+    storm_id: str,
+    wind_threshold: str = "64kt",
+    interval_minutes: int = 15,
+    force_rebuild: bool = False,
+):
+    """Return ``(wind_coverage_polygon, track_line)``, cached as WKB per storm.
+
+    The cache file under ``ENVELOPE_CACHE_DIR`` is keyed on the storm, the
+    envelope settings and a digest of the track columns the envelope is built
+    from, so an updated HURDAT2 track is rebuilt instead of served stale.
+    Storms without any wind polygon are not cached.
+    """
+
+    prefix = wind_threshold.replace("kt", "")
+    key_cols = ["date", "lat", "lon"] + [f"wind_radii_{prefix}_{q}" for q in QUADRANTS]
+    digest = hashlib.sha1(pd.util.hash_pandas_object(track[key_cols], index=False).to_numpy().tobytes()).hexdigest()[:12]
+    cache_file = ENVELOPE_CACHE_DIR / f"{storm_id}_{wind_threshold}_{interval_minutes}min_{digest}.wkb"
+
+    track_line = LineString(list(zip(track['lon'], track['lat'])))
+    if not force_rebuild and cache_file.exists():
+        return shapely.from_wkb(cache_file.read_bytes()), track_line
+
+    wind_coverage, track_line, _ = create_wind_coverage_envelope(
+        track, wind_threshold=wind_threshold, interval_minutes=interval_minutes
+    )
+    if wind_coverage is not None:
+        # Write to a per-process temp file and rename it into place, so other
+        # processes reading the cache never see a half-written envelope
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            ENVELOPE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_bytes(shapely.to_wkb(wind_coverage))
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            tmp_file.unlink(missing_ok=True)  # Read-only checkouts just rebuild next time
+    return wind_coverage, track_line
+
+
 def compute_min_distance_features(
     centroids: pd.DataFrame,
     track: pd.DataFrame,
@@ -185,48 +311,21 @@ def compute_min_distance_features(
     else:
         track_geometry = Point(track_lons[0], track_lats[0])
 
-    min_dist_deg = []
-    for lon, lat in zip(centroid_lons, centroid_lats):
-        centroid_point = Point(lon, lat)
-        dist_deg = centroid_point.distance(track_geometry)
-        min_dist_deg.append(dist_deg)
-
-    min_dist_deg = np.array(min_dist_deg)
+    min_dist_deg = shapely.distance(shapely.points(centroid_lons, centroid_lats), track_geometry)
     min_dist_nm = min_dist_deg * 60.0
     min_dist_km = min_dist_nm * (EARTH_RADIUS_KM / EARTH_RADIUS_NM)
 
-    # Still need nearest track point for quadrant/wind radii
-    distances_to_points_nm = haversine_nm(
-        centroid_lats[:, None],
-        centroid_lons[:, None],
-        track_lats[None, :],
-        track_lons[None, :],
-    )
-    min_idx = distances_to_points_nm.argmin(axis=1)
-
+    # Nearest track fix and its quadrant for every tract in one pass, without an
+    # N x M distance matrix; the 64kt radius is then a fancy-index lookup
+    min_idx, _ = nearest_track_points(centroid_lats, centroid_lons, track_lats, track_lons)
     nearest_track_rows = track.iloc[min_idx].reset_index(drop=True)
 
-    # Determine quadrant-relative 64kt radius at nearest track point
-    quadrant_labels = []
-    radius_nm = []
-    within_64 = []
-
-    for centroid_lat, centroid_lon, track_row, distance_nm in zip(
-        centroid_lats, centroid_lons, nearest_track_rows.itertuples(index=False), min_dist_nm
-    ):
-        lat_diff = centroid_lat - track_row.lat
-        lon_diff = centroid_lon - track_row.lon
-        quad = quadrant_for_offset(lat_diff, lon_diff)
-        quadrant_labels.append(quad.upper())
-
-        radius_col = f"wind_radii_64_{quad}"
-        radius_value = getattr(track_row, radius_col, None)
-        radius_nm.append(radius_value)
+    quadrant_idx = _quadrant_indices(centroid_lats - track_lats[min_idx], centroid_lons - track_lons[min_idx])
+    quadrant_labels = np.char.upper(QUADRANTS[quadrant_idx])
 
-        if pd.isna(radius_value):
-            within_64.append(None)
-        else:
-            within_64.append(distance_nm <= radius_value)
+    radii_64 = track.reindex(columns=[f"wind_radii_64_{quad}" for quad in QUADRANTS]).to_numpy(dtype=float)
+    radius_nm = radii_64[min_idx, quadrant_idx]
+    within_64 = [None if np.isnan(radius) else distance <= radius for distance, radius in zip(min_dist_nm, radius_nm)]
 
     result = pd.DataFrame(
         {
@@ -278,9 +377,20 @@ def run_pipeline(args: argparse.Namespace) -> pd.DataFrame:
     if centroids.empty:
         raise ValueError("No census tract centroids fell within the computed bounds; widen the margin")
 
+    return compute_storm_features(track, centroids, args.storm_id)
+
+
+def compute_storm_features(track: pd.DataFrame, centroids: gpd.GeoDataFrame, storm_id: str) -> pd.DataFrame:
+    """Return tract features for one storm from its track and candidate centroids.
+
+    ``centroids`` are the tract centroid points (with ``GEOID``, ``STATEFP`` and
+    ``COUNTYFP``) around the track; batch jobs that load census tracts once pass
+    their bounding-box subset here so they match :func:`run_pipeline` exactly.
+    """
+
     # Use wind coverage envelope (union of actual wind polygons) instead of alpha shape
     # This eliminates false positives from alpha shape approximation overshoot
-    wind_coverage, track_line, _ = create_wind_coverage_envelope(track, wind_threshold="64kt", interval_minutes=15)
+    wind_coverage, track_line = load_wind_coverage_envelope(track, storm_id, wind_threshold="64kt", interval_minutes=15)
     if wind_coverage is None:
         raise ValueError("Failed to generate wind coverage envelope for storm; cannot compute features")
 
@@ -295,33 +405,23 @@ def run_pipeline(args: argparse.Namespace) -> pd.DataFrame:
 
     base_features = compute_min_distance_features(centroids_in_coverage, track).reset_index(drop=True)
 
+    # Track columns read for every centroid are pulled out once per storm
+    track_lats = track['lat'].to_numpy(dtype=float)
+    track_lons = track['lon'].to_numpy(dtype=float)
+    radii_cols = [f"wind_radii_{kt}_{q}" for kt in (34, 50, 64) for q in ("ne", "se", "sw", "nw")]
+    track_radii = track.reindex(columns=radii_cols).to_numpy(dtype=float)
+
+    # Imputed, 15-minute track for duration checks is the same for every tract
+    duration_track = prepare_duration_track(track, wind_threshold="64kt", interval_minutes=15)
+
     wind_rows = []
     duration_rows = []
     lead_time_rows = []
     for idx, centroid_geom in enumerate(centroids_in_coverage.geometry):
         # Extract wind radii from the nearest track point for this centroid
         nearest_point = track_line.interpolate(track_line.project(centroid_geom))
-        track_distances = track.apply(
-            lambda row: ((row['lat'] - nearest_point.y) ** 2 + (row['lon'] - nearest_point.x) ** 2) ** 0.5,
-            axis=1
-        )
-        nearest_track_idx = track_distances.idxmin()
-        nearest_track_row = track.loc[nearest_track_idx]
-
-        wind_radii = {
-            "wind_radii_34_ne": nearest_track_row.get("wind_radii_34_ne"),
-            "wind_radii_34_se": nearest_track_row.get("wind_radii_34_se"),
-            "wind_radii_34_sw": nearest_track_row.get("wind_radii_34_sw"),
-            "wind_radii_34_nw": nearest_track_row.get("wind_radii_34_nw"),
-            "wind_radii_50_ne": nearest_track_row.get("wind_radii_50_ne"),
-            "wind_radii_50_se": nearest_track_row.get("wind_radii_50_se"),
-            "wind_radii_50_sw": nearest_track_row.get("wind_radii_50_sw"),
-            "wind_radii_50_nw": nearest_track_row.get("wind_radii_50_nw"),
-            "wind_radii_64_ne": nearest_track_row.get("wind_radii_64_ne"),
-            "wind_radii_64_se": nearest_track_row.get("wind_radii_64_se"),
-            "wind_radii_64_sw": nearest_track_row.get("wind_radii_64_sw"),
-            "wind_radii_64_nw": nearest_track_row.get("wind_radii_64_nw"),
-        }
+        nearest_track_idx = np.argmin(np.hypot(track_lats - nearest_point.y, track_lons - nearest_point.x))
+        wind_radii = dict(zip(radii_cols, track_radii[nearest_track_idx]))
 
         try:
             wind_data = calculate_max_wind_experienced(
@@ -352,6 +452,7 @@ def run_pipeline(args: argparse.Namespace) -> pd.DataFrame:
                 interval_minutes=15,
                 envelope=envelope,
                 coverage=wind_coverage,
+                interpolated_track=duration_track,
             )
         )
 
@@ -8,6 +8,7 @@ Creates separate Folium visualizations to validate:
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 import pandas as pd
 import folium
@@ -21,12 +22,45 @@ sys.path.extend([
     str(REPO_ROOT / "02_transformations" / "wind_coverage_envelope" / "src"),
     str(REPO_ROOT / "02_transformations" / "duration" / "src"),
     str(REPO_ROOT / "02_transformations" / "storm_tract_distance" / "src"),
+    str(REPO_ROOT / "03_integration" / "src"),
 ])
 
 from parse_raw import parse_hurdat2_file
 from profile_clean import clean_hurdat2_data
 from envelope_algorithm import impute_missing_wind_radii
 from duration_calculator import interpolate_track_temporal, create_instantaneous_wind_polygon
+from feature_io import existing_storm_features, read_storm_features
+
+# Columns each QA/QC map actually reads from the features CSV; loading only these
+# keeps the per-row iteration below cheap.
+DIST_COLS = [
+    'distance_km', 'distance_nm', 'tract_geoid',
+    'nearest_track_point_lat', 'nearest_track_point_lon',
+    'centroid_lat', 'centroid_lon',
+]
+WIND_COLS = [
+    'max_wind_experienced_kt', 'center_wind_at_approach_kt', 'inside_eyewall',
+    'radius_max_wind_at_approach_nm', 'tract_geoid', 'centroid_lat', 'centroid_lon',
+]
+DURATION_COLS = [
+    'duration_in_envelope_hours', 'exposure_window_hours', 'continuous_exposure',
+    'first_entry_time', 'last_exit_time', 'tract_geoid', 'centroid_lat', 'centroid_lon',
+]
+
+
+def _load_storm_features(storm_id: str, columns) -> pd.DataFrame:
+    """Read ``columns`` from the saved feature file (Parquet or CSV) for ``storm_id``."""
+    features_path = existing_storm_features(REPO_ROOT / "06_outputs" / "ml_ready", storm_id)
+    if features_path is None:
+        raise FileNotFoundError(f"No saved features for {storm_id} in 06_outputs/ml_ready")
+    return read_storm_features(features_path, columns=columns)
+
+
+@lru_cache(maxsize=1)
+def _load_clean_hurdat() -> pd.DataFrame:
+    """Parse and clean HURDAT2 once; the three QA/QC maps share the result."""
+    hurdat_path = REPO_ROOT / "01_data_sources/hurdat2/raw/hurdat2-atlantic.txt"
+    return clean_hurdat2_data(parse_hurdat2_file(hurdat_path))
 
 
 def create_wind_coverage_envelope(track: pd.DataFrame, wind_threshold: str = "64kt", interval_minutes: int = 15):
@@ -98,16 +132,13 @@ def create_distance_qaqc(storm_id: str = 'AL092021') -> folium.Map:
     """
 
     # Load data
-    hurdat_path = REPO_ROOT / "01_data_sources/hurdat2/raw/hurdat2-atlantic.txt"
-    storms = parse_hurdat2_file(hurdat_path)
-    cleaned = clean_hurdat2_data(storms)
+    cleaned = _load_clean_hurdat()
     track = cleaned[cleaned['storm_id'] == storm_id].sort_values('date').reset_index(drop=True)
 
     # Create wind coverage envelope from union of imputed wind radii polygons
     wind_coverage, track_line, _ = create_wind_coverage_envelope(track, wind_threshold='64kt', interval_minutes=15)
 
-    features_path = REPO_ROOT / "06_outputs/ml_ready/al092021_features.csv"
-    features = pd.read_csv(features_path)
+    features = _load_storm_features(storm_id, DIST_COLS)
 
     # Create map
     m = folium.Map(location=[track['lat'].mean(), track['lon'].mean()], zoom_start=7)
@@ -239,16 +270,13 @@ def create_wind_qaqc(storm_id: str = 'AL092021') -> folium.Map:
     """
 
     # Load data
-    hurdat_path = REPO_ROOT / "01_data_sources/hurdat2/raw/hurdat2-atlantic.txt"
-    storms = parse_hurdat2_file(hurdat_path)
-    cleaned = clean_hurdat2_data(storms)
+    cleaned = _load_clean_hurdat()
     track = cleaned[cleaned['storm_id'] == storm_id].sort_values('date').reset_index(drop=True)
 
     # Create wind coverage envelope from union of imputed wind radii polygons
     wind_coverage, track_line, _ = create_wind_coverage_envelope(track, wind_threshold='64kt', interval_minutes=15)
 
-    features_path = REPO_ROOT / "06_outputs/ml_ready/al092021_features.csv"
-    features = pd.read_csv(features_path)
+    features = _load_storm_features(storm_id, WIND_COLS)
 
     # Create map
     m = folium.Map(location=[track['lat'].mean(), track['lon'].mean()], zoom_start=7)
@@ -366,16 +394,13 @@ def create_duration_qaqc(storm_id: str = 'AL092021') -> folium.Map:
     """
 
     # Load data
-    hurdat_path = REPO_ROOT / "01_data_sources/hurdat2/raw/hurdat2-atlantic.txt"
-    storms = parse_hurdat2_file(hurdat_path)
-    cleaned = clean_hurdat2_data(storms)
+    cleaned = _load_clean_hurdat()
     track = cleaned[cleaned['storm_id'] == storm_id].sort_values('date').reset_index(drop=True)
 
     # Create wind coverage envelope from union of imputed wind radii polygons
     wind_coverage, track_line, _ = create_wind_coverage_envelope(track, wind_threshold='64kt', interval_minutes=15)
 
-    features_path = REPO_ROOT / "06_outputs/ml_ready/al092021_features.csv"
-    features = pd.read_csv(features_path)
+    features = _load_storm_features(storm_id, DURATION_COLS)
 
     # Create map
     m = folium.Map(location=[track['lat'].mean(), track['lon'].mean()], zoom_start=7)
@@ -19,12 +19,18 @@ References:
     • Alpha shapes – Edelsbrunner et al., 1983, “On the Shape of a Set of Points in the Plane”.
 """
 import math
+import sys
+from pathlib import Path
 from typing import Iterable, List, Tuple
 
 import pandas as pd
 import numpy as np
 from shapely.geometry import Point, LineString, Polygon, MultiPoint
 
+REPO_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT / "04_src_shared"))
+from geometry_utils import calculate_destination_point_vec
+
 # --- NEW: Accurate Geospatial Helper Function ---
 
 def calculate_destination_point(lat, lon, bearing, distance_nm):
@@ -33,7 +39,9 @@ def calculate_destination_point(lat, lon, bearing, distance_nm):
     This helper treats the Earth as a sphere (radius = 3440.065 NM) and computes the
     destination point reached when travelling *distance_nm* along *bearing* starting at
     *(lat, lon)*. It replaces earlier planar approximations that accrued large errors
-    for long radii (>100 NM).
+    for long radii (>100 NM). Arguments may be NumPy arrays, which are broadcast so
+    many bearings or centres are projected in one call; the kernel itself is
+    ``geometry_utils.calculate_destination_point_vec``.
 
     Args:
         lat (float): Starting latitude in decimal degrees.
@@ -42,31 +50,13 @@ def calculate_destination_point(lat, lon, bearing, distance_nm):
         distance_nm (float): Travel distance in nautical miles.
 
     Returns:
-        tuple[float, float]: `(dest_lon, dest_lat)` in decimal degrees.
+        tuple: `(dest_lon, dest_lat)` in decimal degrees (arrays for array input).
 
     Example:
         >>> calculate_destination_point(29.0, -90.0, 45, 50)
         (-89.409..., 29.589...)
     """
-    R_NM = 3440.065  # Earth radius in nautical miles
-    
-    lat_rad = math.radians(lat)
-    lon_rad = math.radians(lon)
-    bearing_rad = math.radians(bearing)
-    
-    angular_distance = distance_nm / R_NM
-    
-    dest_lat_rad = math.asin(
-        math.sin(lat_rad) * math.cos(angular_distance) +
-        math.cos(lat_rad) * math.sin(angular_distance) * math.cos(bearing_rad)
-    )
-    
-    dest_lon_rad = lon_rad + math.atan2(
-        math.sin(bearing_rad) * math.sin(angular_distance) * math.cos(lat_rad),
-        math.cos(angular_distance) - math.sin(lat_rad) * math.sin(dest_lat_rad)
-    )
-    
-    return (math.degrees(dest_lon_rad), math.degrees(dest_lat_rad))
+    return calculate_destination_point_vec(lat, lon, bearing, distance_nm)
 
 
 # Bearings defining each quadrant arc (degrees). NW wraps beyond 360 to maintain
@@ -116,12 +106,8 @@ def generate_quadrant_arc_points(
     start_bearing, end_bearing = QUADRANT_BEARING_RANGES[quadrant]
     bearings = np.linspace(start_bearing, end_bearing, sample_count, endpoint=include_endpoint)
 
-    points: List[Tuple[float, float]] = []
-    for bearing in bearings:
-        dest_lon, dest_lat = calculate_destination_point(lat, lon, bearing % 360.0, radius_nm)
-        points.append((dest_lon, dest_lat))
-
-    return points
+    dest_lons, dest_lats = calculate_destination_point(lat, lon, bearings % 360.0, radius_nm)
+    return list(zip(dest_lons.tolist(), dest_lats.tolist()))
 
 
 def identify_imputable_segments(storm_track: pd.DataFrame, wind_threshold: str = "64kt") -> pd.Series:
@@ -470,12 +456,53 @@ def create_storm_envelope(storm_track, wind_threshold='64kt', alpha=0.6, verbose
         - Automatically buffers invalid geometries by 0 to restore validity.
         - Returns `(None, LineString(), [])` when insufficient data exist.
     """
-    from shapely.geometry import MultiPoint
-    from shapely.ops import unary_union
+    return create_storm_envelopes(
+        storm_track, wind_thresholds=(wind_threshold,), alpha=alpha, verbose=verbose
+    )[wind_threshold]
 
+
+def create_storm_envelopes(storm_track, wind_thresholds=('34kt', '50kt', '64kt'), alpha=0.6, verbose=False):
+    """Build :func:`create_storm_envelope` results for several wind thresholds at once.
+
+    The track's centre points and centre line do not depend on the threshold, so
+    they are built once and shared; imputation, segmentation and hulls run per
+    threshold exactly as in the single-threshold call.
+
+    Returns:
+        dict[str, tuple]: ``wind_threshold -> (envelope, track line, hull points)``.
+    """
     if verbose:
         print(f"Creating Segmented Alpha Shape envelope for {len(storm_track)} points...")
 
+    # Shared across thresholds. Imputation keeps row order and resets the index,
+    # so segment index labels are positions into track_points
+    track_points = [Point(lon, lat) for lon, lat in zip(storm_track['lon'], storm_track['lat'])]
+    full_track_line = None
+
+    envelopes = {}
+    for wind_threshold in wind_thresholds:
+        final_geom, all_hull_points = _threshold_envelope(storm_track, track_points, wind_threshold, alpha)
+
+        if final_geom is None:
+            envelopes[wind_threshold] = (None, LineString(), [])  # Return empty list
+            continue
+
+        if full_track_line is None:
+            full_track_line = LineString(track_points)
+
+        if verbose:
+            print(f"✅ Alpha shape envelope created. Validity: {final_geom.is_valid}")
+
+        if not final_geom.is_valid:
+            final_geom = final_geom.buffer(0)
+
+        envelopes[wind_threshold] = (final_geom, full_track_line, all_hull_points)
+
+    return envelopes
+
+
+def _threshold_envelope(storm_track, track_points, wind_threshold, alpha):
+    """Union the per-segment hulls for one threshold; returns ``(geometry or None, hull points)``."""
     polygons: List[Polygon] = []
     lines: List[LineString] = []
     all_hull_points = []  # To store points for visualization
@@ -485,7 +512,6 @@ def create_storm_envelope(storm_track, wind_threshold='64kt', alpha=0.6, verbose
     imputed_cols = [f"{col}_imputed" for col in radii_cols]
 
     working_track = impute_missing_wind_radii(storm_track, wind_threshold=wind_threshold)
-
     working_track['has_radii_observed'] = working_track[radii_cols].gt(0).any(axis=1)
     working_track['has_radii'] = working_track[imputed_cols].fillna(0).gt(0).any(axis=1)
     working_track['imputation_begins'] = working_track[f"wind_radii_{prefix}_any_imputed"].fillna(False)
@@ -524,7 +550,7 @@ def create_storm_envelope(storm_track, wind_threshold='64kt', alpha=0.6, verbose
         all_points_for_hull = []
         
         # Add all track points in the segment
-        track_points_in_segment = [Point(p.lon, p.lat) for p in segment_df.itertuples()]
+        track_points_in_segment = [track_points[position] for position in segment_df.index]
         all_points_for_hull.extend(track_points_in_segment)
 
         # Add all wind extent points from the segment (where they exist)
@@ -555,15 +581,4 @@ def create_storm_envelope(storm_track, wind_threshold='64kt', alpha=0.6, verbose
         else:
             final_geom = final_geom.union(geom)
 
-    if final_geom is None:
-        return None, LineString(), [] # Return empty list
-
-    full_track_line = LineString([Point(p.lon, p.lat) for p in working_track.itertuples()])
-
-    if verbose:
-        print(f"✅ Alpha shape envelope created. Validity: {final_geom.is_valid}")
-
-    if not final_geom.is_valid:
-        final_geom = final_geom.buffer(0)
-
-    return final_geom, full_track_line, all_hull_points
+    return final_geom, all_hull_points
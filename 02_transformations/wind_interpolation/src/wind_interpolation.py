@@ -24,6 +24,17 @@ def _haversine_nm(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     return EARTH_RADIUS_NM * c
 
 
+def _distances_to_point_nm(point: Point, track_df: pd.DataFrame) -> np.ndarray:
+    """Return haversine distance (nm) from ``point`` to every row of ``track_df``."""
+
+    lat1 = math.radians(point.y)
+    lat2 = np.radians(track_df["lat"].to_numpy(dtype=float))
+    dlat = lat2 - lat1
+    dlon = np.radians(track_df["lon"].to_numpy(dtype=float)) - math.radians(point.x)
+    a = np.sin(dlat / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return EARTH_RADIUS_NM * 2 * np.arcsin(np.sqrt(a))
+
+
 def find_nearest_point_on_linestring(centroid: Point, track_line: LineString) -> Point:
     """Return the closest point on ``track_line`` to ``centroid``."""
 
@@ -39,13 +50,10 @@ def interpolate_max_wind_at_point(point_on_track: Point, track_df: pd.DataFrame)
     if missing:
         raise ValueError(f"track_df missing columns: {missing}")
 
-    distances_nm = track_df.apply(
-        lambda row: _haversine_nm(point_on_track.y, point_on_track.x, row["lat"], row["lon"]),
-        axis=1,
-    )
-    nearest_indices = np.argsort(distances_nm.values)[:2]
+    distances_nm = _distances_to_point_nm(point_on_track, track_df)
+    nearest_indices = np.argsort(distances_nm)[:2]
     nearest = track_df.iloc[nearest_indices].copy()
-    nearest.loc[:, "dist_nm"] = distances_nm.iloc[nearest_indices].values
+    nearest.loc[:, "dist_nm"] = distances_nm[nearest_indices]
 
     nearest_sorted = nearest.sort_values("dist_nm").reset_index(drop=True)
     if len(nearest_sorted) == 0:
@@ -87,14 +95,11 @@ def interpolate_radius_max_wind_at_point(
     if candidates.empty:
         return _estimate_rmw_from_wind(center_wind)
 
-    distances_nm = candidates.apply(
-        lambda row: _haversine_nm(point_on_track.y, point_on_track.x, row["lat"], row["lon"]),
-        axis=1,
-    )
+    distances_nm = _distances_to_point_nm(point_on_track, candidates)
 
-    nearest_indices = np.argsort(distances_nm.values)[:2]
+    nearest_indices = np.argsort(distances_nm)[:2]
     nearest = candidates.iloc[nearest_indices].copy()
-    nearest.loc[:, "dist_nm"] = distances_nm.iloc[nearest_indices].values
+    nearest.loc[:, "dist_nm"] = distances_nm[nearest_indices]
 
     nearest_sorted = nearest.sort_values("dist_nm").reset_index(drop=True)
     if len(nearest_sorted) == 0:
@@ -1,16 +1,46 @@
 """Process all 14 hurricanes and generate final unified CSV."""
 
+import argparse
+import logging
+import os
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import sys
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-sys.path.insert(0, str(REPO_ROOT / "03_integration" / "src"))
-sys.path.insert(0, str(REPO_ROOT / "01_data_sources" / "hurdat2" / "src"))
-sys.path.insert(0, str(REPO_ROOT / "02_transformations" / "storm_tract_distance" / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "03_integration" / "src"))
 
+from _pathsetup import REPO_ROOT
 from feature_pipeline import extract_all_features_for_storm
 
+logger = logging.getLogger(__name__)
+
+
+def _process_storm(storm_id: str, storm_name: str) -> tuple[pd.DataFrame | None, str]:
+    """Pool task: extract and save one storm's features.
+
+    Returns the features (``None`` when skipped or failed) and a status line,
+    which the parent logs in storm order.
+    """
+    try:
+        # Extract features for this storm
+        storm_features = extract_all_features_for_storm(storm_id)
+        if storm_features.empty:
+            return None, f"⚠️ No tracts found for {storm_name}; skipping"
+
+        # Persist per-storm features for dashboard usage
+        per_storm_path = (
+            REPO_ROOT / "06_outputs" / "ml_ready" / f"{storm_id.lower()}_features.parquet"
+        )
+        per_storm_path.parent.mkdir(parents=True, exist_ok=True)
+        storm_features.to_parquet(per_storm_path, index=False, compression="zstd")
+
+        return storm_features, f"✅ Extracted {len(storm_features)} tract features"
+
+    except Exception as e:
+        return None, f"❌ Error processing {storm_name}: {e}"
+
+
 def main():
     """
     Process all 14 Gulf Coast hurricanes (2005-2022).
@@ -26,48 +56,38 @@ def main():
 
     Steps:
     1. Load storm list from batch_processing_summary.csv
-    2. For each storm:
+    2. For each storm (in parallel worker processes):
         a. Extract all features using feature_pipeline.py
         b. Append to master DataFrame
     3. Save unified output: 06_outputs/ml_ready/storm_tract_features.csv
     4. Generate summary statistics
+
+    Per-storm progress is one log line each, shown with ``--verbose``;
+    skipped and failed storms are always reported.
     """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--verbose", action="store_true", help="Log per-storm progress")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format="%(message)s")
+
     # Load storm list
     summary_path = REPO_ROOT / "01_data_sources" / "hurdat2" / "processed" / "batch_processing_summary.csv"
     storms = pd.read_csv(summary_path)
 
     all_features = []
 
-    for idx, storm_row in storms.iterrows():
-        storm_id = storm_row['storm_id']
-        storm_name = storm_row['name']
-        year = storm_row['year']
-
-        print(f"\n{'='*60}")
-        print(f"Processing: {storm_name} ({year}) - {storm_id}")
-        print(f"{'='*60}")
-
-        try:
-            # Extract features for this storm
-            storm_features = extract_all_features_for_storm(storm_id)
-            if storm_features.empty:
-                print(f"⚠️ No tracts found for {storm_name}; skipping")
-                continue
-
-            # Persist per-storm features for dashboard usage
-            per_storm_path = (
-                REPO_ROOT / "06_outputs" / "ml_ready" / f"{storm_id.lower()}_features.csv"
-            )
-            per_storm_path.parent.mkdir(parents=True, exist_ok=True)
-            storm_features.to_csv(per_storm_path, index=False)
-
-            all_features.append(storm_features)
-
-            print(f"✅ Extracted {len(storm_features)} tract features")
-
-        except Exception as e:
-            print(f"❌ Error processing {storm_name}: {e}")
-            continue
+    # Storms are independent, so extract them in parallel and report in storm order
+    max_workers = min(len(storms), os.cpu_count() or 1) or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(_process_storm, storms['storm_id'], storms['name'])
+
+        for idx, ((storm_id, storm_name, year), (storm_features, status)) in enumerate(zip(
+            storms[['storm_id', 'name', 'year']].itertuples(index=False), results
+        ), 1):
+            level = logging.INFO if storm_features is not None else logging.WARNING
+            logger.log(level, "[%2d/%d] %s (%s) - %s: %s", idx, len(storms), storm_name, year, storm_id, status)
+            if storm_features is not None:
+                all_features.append(storm_features)
 
     # Concatenate all storms
     final_df = pd.concat(all_features, ignore_index=True)
@@ -1,29 +1,48 @@
 """Combine all individual storm features into one table with selected columns."""
 
-import pandas as pd
 from pathlib import Path
-import glob
+import argparse
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "03_integration" / "src"))
+
+from feature_io import (
+    FINAL_COLUMN_DTYPES,
+    FINAL_COLUMNS,
+    find_storm_feature_files,
+    read_storm_features,
+    stream_combined_features,
+    write_storm_index,
+)
+
 ML_READY_DIR = REPO_ROOT / "06_outputs" / "ml_ready"
 
-# Columns to keep in the final combined table
-FINAL_COLUMNS = [
-    "storm_name",
-    "tract_geoid",
-    "distance_km",
-    "max_wind_experienced_kt",
-    "duration_in_envelope_hours",
-    "lead_time_cat1_hours",
-    "lead_time_cat2_hours",
-    "lead_time_cat3_hours",
-    "lead_time_cat4_hours",
-]
+# Files parsed concurrently; the Parquet and CSV parsers release the GIL for most of the work
+LOAD_MAX_WORKERS = 4
+
+logger = logging.getLogger(__name__)
+
+
+def _load_one(file_path: Path):
+    """Read one storm's FINAL_COLUMNS, returning (frame or None, load error or None)."""
+    try:
+        return read_storm_features(file_path, columns=FINAL_COLUMNS, dtype=FINAL_COLUMN_DTYPES), None
+    except Exception as e:
+        return None, e
+
 
 def main():
     """Combine all storm feature files."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--verbose", action="store_true", help="Log per-file progress")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format="%(message)s")
+
     # Find all individual storm feature files
-    feature_files = glob.glob(str(ML_READY_DIR / "al*_features.csv"))
+    feature_files = find_storm_feature_files(ML_READY_DIR)
 
     if not feature_files:
         print("❌ No feature files found!")
@@ -31,52 +50,41 @@ def main():
 
     print(f"Found {len(feature_files)} storm feature files")
 
-    all_data = []
-
-    for file_path in sorted(feature_files):
-        storm_file = Path(file_path).name
-        print(f"  Loading {storm_file}...")
-
-        try:
-            df = pd.read_csv(file_path)
-
-            # Check which columns exist
-            available_cols = [col for col in FINAL_COLUMNS if col in df.columns]
-            missing_cols = [col for col in FINAL_COLUMNS if col not in df.columns]
+    def _storm_frames(executor):
+        # map() yields in file order, so the combined output order is unchanged
+        for file_path, (df, error) in zip(feature_files, executor.map(_load_one, feature_files)):
+            logger.info("  Loading %s...", file_path.name)
+            if error is not None:
+                logger.error("    ❌ Error loading %s: %s", file_path.name, error)
+                continue
 
+            available = set(df.columns)
+            missing_cols = [col for col in FINAL_COLUMNS if col not in available]
             if missing_cols:
-                print(f"    ⚠️  Missing columns: {missing_cols}")
+                logger.warning("    ⚠️  %s missing columns: %s", file_path.name, missing_cols)
 
-            # Select only available columns
-            df_subset = df[available_cols]
-            all_data.append(df_subset)
+            logger.info("    ✅ %d records", len(df))
+            yield df
 
-            print(f"    ✅ {len(df_subset):,} records")
-
-        except Exception as e:
-            print(f"    ❌ Error loading {storm_file}: {e}")
-            continue
+    # Stream each storm straight into the combined CSV and Parquet outputs
+    output_path = ML_READY_DIR / "storm_tract_features.csv"
+    with ThreadPoolExecutor(max_workers=LOAD_MAX_WORKERS) as executor:
+        storm_counts = stream_combined_features(_storm_frames(executor), output_path, FINAL_COLUMNS)
+    write_storm_index(ML_READY_DIR)
 
-    if not all_data:
+    if storm_counts.empty:
         print("❌ No data to combine!")
         return
 
-    # Combine all storms
-    combined = pd.concat(all_data, ignore_index=True)
-
-    # Save combined output
-    output_path = ML_READY_DIR / "storm_tract_features.csv"
-    combined.to_csv(output_path, index=False)
-
     print(f"\n{'='*60}")
     print(f"COMBINED FEATURES CREATED")
     print(f"{'='*60}")
-    print(f"Total storms: {len(all_data)}")
-    print(f"Total records: {len(combined):,}")
-    print(f"Columns: {list(combined.columns)}")
-    print(f"Output: {output_path}")
+    print(f"Total storms: {len(storm_counts)}")
+    print(f"Total records: {storm_counts.sum():,}")
+    print(f"Columns: {FINAL_COLUMNS}")
+    print(f"Output: {output_path} (+ {output_path.with_suffix('.parquet').name})")
     print(f"\nRecords by storm:")
-    print(combined.groupby('storm_name').size().sort_values(ascending=False))
+    print(storm_counts.sort_values(ascending=False))
 
 if __name__ == "__main__":
     main()
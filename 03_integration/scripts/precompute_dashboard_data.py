@@ -3,11 +3,15 @@ Pre-computes and saves all data required for the multi-storm dashboard.
 
 This script iterates through the target hurricanes, loads their feature data,
 computes their storm track and wind coverage envelopes, and saves the combined
-data into a series of dashboard-ready GeoJSON files.
+data into a series of dashboard-ready GeoJSON files (with GeoParquet copies).
 """
 
+import argparse
 import json
+import logging
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import geopandas as gpd
@@ -19,12 +23,13 @@ REPO_ROOT = Path(__file__).resolve().parents[2]
 sys.path.extend([
     str(REPO_ROOT / "01_data_sources" / "hurdat2" / "src"),
     str(REPO_ROOT / "02_transformations" / "storm_tract_distance" / "src"),
+    str(REPO_ROOT / "03_integration" / "src"),
 ])
 
 # --- Import project-specific modules ---
-from parse_raw import parse_hurdat2_file
-from profile_clean import clean_hurdat2_data
-from storm_tract_distance import create_wind_coverage_envelope
+from clean_cache import load_clean_hurdat2
+from storm_tract_distance import load_wind_coverage_envelope
+from feature_io import FEATURE_FILE_SUFFIXES
 
 # --- Define constants for file paths ---
 HURDAT_PATH = REPO_ROOT / "01_data_sources" / "hurdat2" / "input_data" / "hurdat2-atlantic.txt"
@@ -32,90 +37,140 @@ TARGET_HURRICANES_PATH = REPO_ROOT / "00_config" / "target_hurricanes.json"
 FEATURES_DIR = REPO_ROOT / "06_outputs" / "ml_ready"
 OUTPUT_DIR = REPO_ROOT / "07_dashboard_app" / "data"
 
+logger = logging.getLogger(__name__)
+
+
+def _find_feature_file(feature_files: dict[str, Path], storm_id: str, storm_name: str) -> Path | None:
+    """Pick a storm's feature file from a single listing of ``FEATURES_DIR``.
+
+    File names are inconsistent, so after the standard ``<id>_features`` names
+    fall back to a CSV starting with the storm ID, then one containing its name.
+    """
+    storm_key, name_key = storm_id.lower(), storm_name.lower()
+    for suffix in FEATURE_FILE_SUFFIXES:
+        if f"{storm_key}_features{suffix}" in feature_files:
+            return feature_files[f"{storm_key}_features{suffix}"]
+    csv_names = [name for name in feature_files if name.endswith(".csv")]
+    match = next((name for name in csv_names if name.startswith(storm_key)), None)
+    if match is None:
+        match = next((name for name in csv_names if name_key in name), None)
+    return feature_files[match] if match else None
+
+
+def _process_storm(storm_info: dict, track_df: pd.DataFrame, feature_files: dict[str, Path]) -> list[tuple[int, str]]:
+    """Pool task: build and save one storm's dashboard file.
+
+    Returns ``(level, message)`` pairs so the parent can log them in storm order.
+    """
+    storm_id = storm_info["storm_id"]
+    storm_name = storm_info["name"]
+    log = [(logging.INFO, f"\n--- Processing: {storm_name} ({storm_id}) ---")]
+
+    # 1. The storm track was sliced from the cleaned HURDAT data by the parent
+    if track_df.empty:
+        log.append((logging.WARNING, f"  [!] WARNING: No track data found for {storm_id}. Skipping."))
+        return log
+    log.append((logging.INFO, f"  - Found {len(track_df)} track points."))
+
+    # 2. Load the corresponding tract-level feature data first, so storms
+    # without features skip the envelope build entirely
+    feature_path = _find_feature_file(feature_files, storm_id, storm_name)
+    if feature_path is None:
+        log.append((logging.WARNING, f"  [!] WARNING: No feature file found for {storm_id}. Skipping."))
+        return log
+
+    log.append((logging.INFO, f"  - Loading features from: {feature_path.name}"))
+    if feature_path.suffix == ".parquet":
+        features_df = pd.read_parquet(feature_path)
+    else:
+        features_df = pd.read_csv(feature_path)
+    if features_df.empty:
+        log.append((logging.WARNING, f"  [!] WARNING: No tracts in {feature_path.name}. Skipping."))
+        return log
+
+    # 3. Compute the wind coverage envelope and track line
+    try:
+        coverage, track_line = load_wind_coverage_envelope(track_df, storm_id, wind_threshold="64kt")
+        if coverage is None or coverage.is_empty:
+            log.append((logging.WARNING, f"  [!] WARNING: Could not generate wind envelope for {storm_id}. Skipping."))
+            return log
+        log.append((logging.INFO, "  - Successfully generated wind envelope and track line."))
+    except Exception as e:
+        log.append((logging.ERROR, f"  [!] ERROR: Failed to create envelope for {storm_id}: {e}. Skipping."))
+        return log
+
+    # 4. Build tract centroid points straight from the coordinate arrays
+    tract_points = gpd.GeoSeries.from_xy(
+        features_df["centroid_lon"].to_numpy(),
+        features_df["centroid_lat"].to_numpy(),
+    )
+    log.append((logging.INFO, f"  - Converted {len(features_df)} tracts to centroid points."))
+
+    # 5-6. Prepend the envelope and track rows and wrap everything in a single
+    # GeoDataFrame, instead of concatenating three small GeoDataFrames
+    header_df = pd.DataFrame({"type": ["envelope", "track"], "storm_id": [storm_id, storm_id]})
+    records = pd.concat([header_df, features_df.assign(type="tract")], ignore_index=True)
+    geometries = [coverage, track_line, *tract_points]
+    combined_gdf = gpd.GeoDataFrame(records, geometry=geometries, crs="EPSG:4326")
+    log.append((logging.INFO, "  - Combined envelope, track, and tracts into a single GeoDataFrame."))
+
+    # 7. Save the final output to a GeoJSON file (plus a GeoParquet copy,
+    # which binary-aware loaders read far faster than GeoJSON)
+    output_path = OUTPUT_DIR / f"{storm_id}.geojson"
+    try:
+        # Note: GeoPandas handles NaN/NaT values when writing to GeoJSON;
+        # pyogrio writes the whole frame in one bulk GDAL call
+        combined_gdf.to_file(output_path, driver="GeoJSON", engine="pyogrio")
+        combined_gdf.to_parquet(output_path.with_suffix(".parquet"), index=False)
+        log.append((logging.INFO, f"  -> Successfully saved output to {output_path}"))
+    except Exception as e:
+        log.append((logging.ERROR, f"  [!] ERROR: Failed to write GeoJSON file for {storm_id}: {e}"))
+
+    return log
+
 
 def main():
     """Main function to run the pre-computation pipeline."""
+    parser = argparse.ArgumentParser(description="Pre-compute dashboard GeoJSON files")
+    parser.add_argument("--verbose", action="store_true", help="Log per-storm progress")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format="%(message)s")
+
     print("--- Starting Dashboard Pre-computation Script ---")
 
     # Ensure output directory exists
     OUTPUT_DIR.mkdir(exist_ok=True)
-    print(f"Output directory is: {OUTPUT_DIR}")
+    logger.info("Output directory is: %s", OUTPUT_DIR)
 
     # --- Load shared data once ---
-    print(f"Loading and cleaning HURDAT data from {HURDAT_PATH}...")
-    hurdat_raw = parse_hurdat2_file(str(HURDAT_PATH))
-    hurdat_clean = clean_hurdat2_data(hurdat_raw)
-    print("HURDAT data loaded and cleaned.")
+    logger.info("Loading and cleaning HURDAT data from %s...", HURDAT_PATH)
+    hurdat_clean = load_clean_hurdat2(HURDAT_PATH)
+    logger.info("HURDAT data loaded and cleaned.")
 
     with open(TARGET_HURRICANES_PATH) as f:
         target_hurricanes = json.load(f)["target_hurricanes"]
-    print(f"Loaded {len(target_hurricanes)} target hurricanes.")
-
-    # --- Main processing loop for each storm ---
-    for storm_info in target_hurricanes:
-        storm_id = storm_info["storm_id"]
-        storm_name = storm_info["name"]
-        print(f"\n--- Processing: {storm_name} ({storm_id}) ---")
-
-        # 1. Get storm track from the cleaned HURDAT data
-        track_df = hurdat_clean[hurdat_clean["storm_id"] == storm_id].sort_values("date").reset_index(drop=True)
-        if track_df.empty:
-            print(f"  [!] WARNING: No track data found for {storm_id}. Skipping.")
-            continue
-        print(f"  - Found {len(track_df)} track points.")
-
-        # 2. Compute the wind coverage envelope and track line
-        try:
-            coverage, track_line, _ = create_wind_coverage_envelope(track_df, wind_threshold="64kt")
-            if coverage is None or coverage.is_empty:
-                print(f"  [!] WARNING: Could not generate wind envelope for {storm_id}. Skipping.")
-                continue
-            print("  - Successfully generated wind envelope and track line.")
-        except Exception as e:
-            print(f"  [!] ERROR: Failed to create envelope for {storm_id}: {e}. Skipping.")
-            continue
-
-        # 3. Load the corresponding tract-level feature data
-        # Note: File names are inconsistent, so we search for a file starting with the storm ID.
-        feature_files = list(FEATURES_DIR.glob(f"{storm_id.lower()}*.csv"))
-        if not feature_files:
-            # Try another common pattern if the first fails
-            feature_files = list(FEATURES_DIR.glob(f"*{storm_name.lower()}*.csv"))
-
-        if not feature_files:
-            print(f"  [!] WARNING: No feature CSV found for {storm_id}. Skipping.")
-            continue
-
-        feature_path = feature_files[0]
-        print(f"  - Loading features from: {feature_path.name}")
-        features_df = pd.read_csv(feature_path)
-
-        # 4. Convert feature DataFrame to a GeoDataFrame of tract centroids
-        tract_gdf = gpd.GeoDataFrame(
-            features_df,
-            geometry=gpd.points_from_xy(features_df.centroid_lon, features_df.centroid_lat),
-            crs="EPSG:4326"
+    logger.info("Loaded %d target hurricanes.", len(target_hurricanes))
+
+    # --- Process storms in parallel; each worker gets only its own track ---
+    tracks_by_id = {
+        storm_id: group.sort_values("date").reset_index(drop=True)
+        for storm_id, group in hurdat_clean.groupby("storm_id", sort=False)
+    }
+    empty_track = hurdat_clean.iloc[0:0]
+    tracks = [tracks_by_id.get(storm_info["storm_id"], empty_track) for storm_info in target_hurricanes]
+    # One listing of the features directory serves every storm's lookup
+    feature_files = {path.name: path for path in sorted(FEATURES_DIR.iterdir()) if path.is_file()}
+    max_workers = min(len(target_hurricanes), os.cpu_count() or 1) or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        logs = executor.map(
+            _process_storm,
+            target_hurricanes,
+            tracks,
+            [feature_files] * len(target_hurricanes),
         )
-        tract_gdf["type"] = "tract"
-        print(f"  - Converted {len(tract_gdf)} tracts to GeoDataFrame.")
-
-        # 5. Create GeoDataFrames for the envelope and track
-        envelope_gdf = gpd.GeoDataFrame([{"type": "envelope", "storm_id": storm_id}], geometry=[coverage], crs="EPSG:4326")
-        track_gdf = gpd.GeoDataFrame([{"type": "track", "storm_id": storm_id}], geometry=[track_line], crs="EPSG:4326")
-
-        # 6. Combine all geometries into a single GeoDataFrame
-        # Use pd.concat as gpd.concat is deprecated
-        combined_gdf = gpd.GeoDataFrame(pd.concat([envelope_gdf, track_gdf, tract_gdf], ignore_index=True), crs="EPSG:4326")
-        print("  - Combined envelope, track, and tracts into a single GeoDataFrame.")
-
-        # 7. Save the final output to a GeoJSON file
-        output_path = OUTPUT_DIR / f"{storm_id}.geojson"
-        try:
-            # Note: GeoPandas handles NaN/NaT values when writing to GeoJSON
-            combined_gdf.to_file(output_path, driver="GeoJSON")
-            print(f"  -> Successfully saved output to {output_path}")
-        except Exception as e:
-            print(f"  [!] ERROR: Failed to write GeoJSON file for {storm_id}: {e}")
+        for log in logs:
+            for level, message in log:
+                logger.log(level, message)
 
     print("\n--- Dashboard Pre-computation Complete ---")
 
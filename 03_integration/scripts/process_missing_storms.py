@@ -1,12 +1,16 @@
 """Process the 9 missing storms and create combined output."""
 
-import pandas as pd
 from pathlib import Path
+import argparse
+import logging
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(REPO_ROOT / "03_integration" / "src"))
 
+from feature_io import write_storm_index
 from feature_pipeline import save_features_for_storm
 
 # Missing storms
@@ -22,27 +26,45 @@ MISSING_STORMS = [
     "AL282020",  # ZETA
 ]
 
+ML_READY_DIR = REPO_ROOT / "06_outputs" / "ml_ready"
+
+logger = logging.getLogger(__name__)
+
+
+def _process_one(storm_id: str) -> Path:
+    """Pool task: extract and save one storm's features."""
+    return save_features_for_storm(
+        storm_id=storm_id,
+        output_path=ML_READY_DIR / f"{storm_id.lower()}_features.parquet",
+    )
+
+
 def main():
     """Process missing storms."""
-    ml_ready_dir = REPO_ROOT / "06_outputs" / "ml_ready"
-    ml_ready_dir.mkdir(parents=True, exist_ok=True)
-
-    for storm_id in MISSING_STORMS:
-        output_path = ml_ready_dir / f"{storm_id.lower()}_features.csv"
-
-        print(f"\n{'='*60}")
-        print(f"Processing {storm_id}")
-        print(f"{'='*60}")
-
-        try:
-            save_features_for_storm(
-                storm_id=storm_id,
-                output_path=output_path,
-            )
-            print(f"✅ Saved to {output_path}")
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            continue
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--verbose", action="store_true", help="Log per-storm progress")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format="%(message)s")
+
+    ML_READY_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Storms are independent (each worker parses its own track), so run them in parallel
+    max_workers = min(len(MISSING_STORMS), os.cpu_count() or 1)
+    logger.info("Processing %d storms on %d workers...", len(MISSING_STORMS), max_workers)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_process_one, storm_id): storm_id for storm_id in MISSING_STORMS}
+        for future in as_completed(futures):
+            storm_id = futures[future]
+            try:
+                output_path = future.result()
+            except Exception as e:
+                logger.error("❌ %s: %s", storm_id, e)
+                continue
+            logger.info("✅ %s: saved to %s", storm_id, output_path)
+
+    # Refresh the dashboard's per-storm summary index
+    write_storm_index(ML_READY_DIR)
 
 if __name__ == "__main__":
     main()
@@ -1,9 +1,11 @@
 """Process the 9 missing storms with detailed logging."""
 
-import pandas as pd
 from pathlib import Path
+import os
 import sys
 import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(REPO_ROOT / "03_integration" / "src"))
@@ -23,37 +25,44 @@ MISSING_STORMS = [
     "AL282020",  # ZETA
 ]
 
+ML_READY_DIR = REPO_ROOT / "06_outputs" / "ml_ready"
+
+
+def _process_one(storm_id: str):
+    """Pool task: save one storm's features and return (elapsed, status, traceback)."""
+    storm_start = time.time()
+
+    try:
+        output_path = save_features_for_storm(
+            storm_id=storm_id,
+            output_path=ML_READY_DIR / f"{storm_id.lower()}_features.parquet",
+        )
+    except Exception as e:
+        return time.time() - storm_start, f"❌ Error: {e}", traceback.format_exc()
+
+    return time.time() - storm_start, f"✅ Saved to {output_path.name}", None
+
+
 def main():
     """Process missing storms with timing."""
-    ml_ready_dir = REPO_ROOT / "06_outputs" / "ml_ready"
-    ml_ready_dir.mkdir(parents=True, exist_ok=True)
+    ML_READY_DIR.mkdir(parents=True, exist_ok=True)
 
     overall_start = time.time()
 
-    for idx, storm_id in enumerate(MISSING_STORMS, 1):
-        output_path = ml_ready_dir / f"{storm_id.lower()}_features.csv"
+    max_workers = min(len(MISSING_STORMS), os.cpu_count() or 1)
+    print(f"  Starting feature extraction for {len(MISSING_STORMS)} storms on {max_workers} workers...")
 
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_process_one, MISSING_STORMS))
+
+    # Report in storm order once every worker has finished
+    for idx, (storm_id, (elapsed, status, trace)) in enumerate(zip(MISSING_STORMS, results), 1):
         print(f"\n{'='*60}")
-        print(f"[{idx}/9] Processing {storm_id}")
+        print(f"[{idx}/{len(MISSING_STORMS)}] {storm_id}")
         print(f"{'='*60}")
-
-        storm_start = time.time()
-
-        try:
-            print(f"  Starting feature extraction...")
-            save_features_for_storm(
-                storm_id=storm_id,
-                output_path=output_path,
-            )
-            elapsed = time.time() - storm_start
-            print(f"  ✅ Saved to {output_path.name} ({elapsed:.1f}s)")
-
-        except Exception as e:
-            elapsed = time.time() - storm_start
-            print(f"  ❌ Error after {elapsed:.1f}s: {e}")
-            import traceback
-            traceback.print_exc()
-            continue
+        print(f"  {status} ({elapsed:.1f}s)")
+        if trace:
+            print(trace)
 
     total_elapsed = time.time() - overall_start
     print(f"\n{'='*60}")
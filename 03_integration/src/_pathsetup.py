@@ -0,0 +1,28 @@
+"""Register the repository's numbered ``src`` folders on ``sys.path``.
+
+The integration layer imports sibling modules from several source folders that
+are not installable packages. Importing this module once per interpreter makes
+them resolvable; later imports are no-ops because Python caches the module, so
+batch runs pay the path setup (and the heavy imports that follow) only once.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+SOURCE_DIRS = [
+    REPO_ROOT / "01_data_sources" / "hurdat2" / "src",
+    REPO_ROOT / "01_data_sources" / "census" / "src",
+    REPO_ROOT / "02_transformations" / "storm_tract_distance" / "src",
+    REPO_ROOT / "02_transformations" / "wind_interpolation" / "src",
+    REPO_ROOT / "02_transformations" / "duration" / "src",
+    REPO_ROOT / "02_transformations" / "lead_time" / "src",
+    REPO_ROOT / "03_integration" / "src",
+]
+
+for _source_dir in map(str, SOURCE_DIRS):
+    if _source_dir not in sys.path:
+        sys.path.append(_source_dir)
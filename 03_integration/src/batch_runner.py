@@ -0,0 +1,224 @@
+"""Shared batch runner for extracting tract features across many storms.
+
+The ``03_integration/scripts/batch_*`` entry points only choose which storms to
+run; census centroids and the HURDAT2 index are loaded once here and handed to
+a process pool, and finished storms are combined into
+``storm_tract_features.csv``.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Mapping, Sequence
+
+import pandas as pd
+
+from _pathsetup import REPO_ROOT
+
+from parse_raw_indexed import parse_storm_by_id, get_or_build_index
+from profile_clean import clean_hurdat2_data
+from tract_centroids import load_tracts_with_centroids
+from storm_tract_distance import compute_storm_features, track_bounds
+from intensification_features import calculate_intensification_features
+from feature_io import (
+    FINAL_COLUMN_DTYPES,
+    FINAL_COLUMNS,
+    existing_storm_features,
+    find_storm_feature_files,
+    read_storm_features,
+    stream_combined_features,
+    write_storm_index,
+)
+
+DEFAULT_HURDAT_PATH = str(REPO_ROOT / "01_data_sources" / "hurdat2" / "raw" / "hurdat2-atlantic.txt")
+ML_READY_DIR = REPO_ROOT / "06_outputs" / "ml_ready"
+
+GULF_STATES = ['22', '28', '48', '01', '12']  # LA, MS, TX, AL, FL
+
+# Tract attributes carried into the features, as loaded by run_pipeline
+TRACT_COLUMNS = ["GEOID", "STATEFP", "COUNTYFP", "TRACTCE"]
+
+
+# Shared inputs for pool workers, filled once per process by _init_worker
+_WORKER_STATE = {}
+
+# Forked workers inherit the initializer arguments with the parent's memory
+# (copy-on-write) instead of unpickling them; pinned so a different default
+# start method does not turn that into a per-worker pickle of the census tracts
+_POOL_CONTEXT = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+
+
+def _init_worker(tract_data, hurdat_path: str, index: dict) -> None:
+    """Keep the pre-loaded census and index in the worker so each is sent once."""
+    _WORKER_STATE.update(tract_data=tract_data, hurdat_path=hurdat_path, index=index)
+
+
+def _process_storm_in_worker(storm_id: str):
+    """Pool task: process one storm against the worker's shared census data."""
+    storm_start = time.time()
+    features = process_storm(
+        storm_id, _WORKER_STATE["tract_data"], _WORKER_STATE["hurdat_path"], _WORKER_STATE["index"]
+    )
+    return features, time.time() - storm_start
+
+
+def process_storm(storm_id: str, tract_data, hurdat_path: str, index: dict) -> pd.DataFrame:
+    """Process a single storm using pre-loaded census data and the HURDAT2 index.
+
+    Features come from ``storm_tract_distance.compute_storm_features`` plus the
+    storm's intensification metrics, so they match ``feature_pipeline``'s output.
+    """
+
+    # Parse only this storm's data (FAST with indexed parser!)
+    df_raw = parse_storm_by_id(hurdat_path, storm_id, index=index)
+    df_clean = clean_hurdat2_data(df_raw)
+    track = df_clean.sort_values('date').reset_index(drop=True)
+
+    if track.empty:
+        return pd.DataFrame()
+
+    # Keep tracts overlapping the storm bounds, the same filter run_pipeline's
+    # census load applies
+    minx, miny, maxx, maxy = track_bounds(track, margin_deg=3.0)
+    in_bounds = tract_data.tracts.cx[minx:maxx, miny:maxy].index
+    if in_bounds.empty:
+        return pd.DataFrame()
+
+    features = compute_storm_features(track, tract_data.centroids.loc[in_bounds], storm_id)
+    if features.empty:
+        return features
+
+    return features.assign(**calculate_intensification_features(track))
+
+
+def write_combined_features(output_dir: Path = ML_READY_DIR) -> pd.Series:
+    """Combine every per-storm feature file into ``storm_tract_features.csv``/``.parquet``.
+
+    Returns record counts by storm.
+    """
+
+    output_path = Path(output_dir) / "storm_tract_features.csv"
+    frames = (
+        read_storm_features(path, columns=FINAL_COLUMNS, dtype=FINAL_COLUMN_DTYPES)
+        for path in find_storm_feature_files(output_dir)
+    )
+    storm_counts = stream_combined_features(frames, output_path, FINAL_COLUMNS)
+    write_storm_index(output_dir)
+    if storm_counts.empty:
+        return storm_counts
+
+    print(f"  ✅ Saved {storm_counts.sum():,} records to {output_path.name} (+ Parquet)")
+    print(f"  Columns: {FINAL_COLUMNS}")
+    print(f"\n  Records by storm:")
+    for storm, count in storm_counts.sort_values(ascending=False).items():
+        print(f"    {storm:12s} {count:6,}")
+
+    return storm_counts
+
+
+def run_batch(
+    storm_ids: Sequence[str],
+    tract_data=None,
+    hurdat_path: str = DEFAULT_HURDAT_PATH,
+    workers: int | None = None,
+    storm_names: Mapping[str, str] | None = None,
+    output_dir: Path = ML_READY_DIR,
+) -> pd.Series:
+    """Extract features for ``storm_ids`` and rebuild the combined feature table.
+
+    Args:
+        storm_ids: HURDAT2 storm identifiers to process.
+        tract_data: Pre-loaded ``TractData`` (tract polygons and centroids with
+            GEOID/STATEFP/COUNTYFP); loaded for the Gulf states when omitted.
+        hurdat_path: Path to the HURDAT2 source file.
+        workers: Pool size (defaults to one per pending storm, capped at CPU count).
+        storm_names: Optional display names for progress output.
+        output_dir: Directory holding per-storm feature files.
+
+    Returns:
+        Record counts by storm in the rebuilt combined table.
+    """
+
+    overall_start = time.time()
+    storm_names = storm_names or {}
+    total = len(storm_ids)
+
+    # Step 1: Build HURDAT2 index (one-time, cached)
+    print("\n[1/4] Building HURDAT2 index...")
+    index_start = time.time()
+    index = get_or_build_index(hurdat_path)
+    print(f"  ✅ Indexed {len(index)} storms ({time.time() - index_start:.2f}s)")
+
+    # Step 2: Load census data ONCE for all storms
+    print("\n[2/4] Loading census tract data (ONE TIME)...")
+    census_start = time.time()
+    if tract_data is None:
+        tract_data = load_tracts_with_centroids(year=2019, columns=TRACT_COLUMNS, states=GULF_STATES)
+    print(f"  ✅ Loaded {len(tract_data.centroids)} tracts ({time.time() - census_start:.1f}s)")
+
+    # Step 3: Process each storm
+    print("\n[3/4] Processing storms...")
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    processed_count = 0
+    pending = []
+
+    for idx, storm_id in enumerate(storm_ids, 1):
+        label = f"  [{idx:2d}/{total}] {storm_names.get(storm_id, storm_id):8s} ({storm_id}):"
+
+        # Skip if already exists
+        if existing_storm_features(output_dir, storm_id) is not None:
+            print(f"{label} Already exists ✓")
+            continue
+
+        pending.append((label, storm_id, output_dir / f"{storm_id.lower()}_features.parquet"))
+
+    # Storms are independent given the shared census data, so run them in parallel
+    if pending:
+        max_workers = workers or min(len(pending), os.cpu_count() or 1)
+        print(f"  Processing {len(pending)} storms on {max_workers} workers...")
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=_POOL_CONTEXT,
+            initializer=_init_worker,
+            initargs=(tract_data, hurdat_path, index),
+        ) as executor:
+            futures = {
+                executor.submit(_process_storm_in_worker, storm_id): (label, output_path)
+                for label, storm_id, output_path in pending
+            }
+            for future in as_completed(futures):
+                label, output_path = futures[future]
+
+                try:
+                    features, elapsed = future.result()
+                except Exception as e:
+                    print(f"{label} ❌ {e}")
+                    traceback.print_exception(e)
+                    continue
+
+                if not features.empty:
+                    features.to_parquet(output_path, index=False, compression="zstd")
+                    print(f"{label} ✅ ({elapsed:.1f}s, {len(features):,} records)")
+                    processed_count += 1
+                else:
+                    print(f"{label} ⚠️  No records")
+
+    # Step 4: Combine new and existing storms
+    print("\n[4/4] Creating combined feature table...")
+    storm_counts = write_combined_features(output_dir)
+
+    total_time = time.time() - overall_start
+    print(f"\n{'='*60}")
+    print(f"COMPLETE")
+    print(f"  New storms processed: {processed_count}")
+    print(f"  Total time: {total_time:.1f}s ({total_time/60:.1f} min)")
+    print(f"{'='*60}")
+
+    return storm_counts
@@ -1,8 +1,8 @@
+import argparse
 import sys
 from pathlib import Path
 import pandas as pd
 import geopandas as gpd
-import matplotlib.pyplot as plt
 from shapely.geometry import Point, LineString
 
 # Add project src path to allow importing modules
@@ -10,16 +10,75 @@ REPO_ROOT = Path(__file__).resolve().parents[2]
 sys.path.extend(
     [
         str(REPO_ROOT / "01_data_sources" / "hurdat2" / "src"),
+        str(REPO_ROOT / "02_transformations" / "storm_tract_distance" / "src"),
     ]
 )
 
 from parse_raw import parse_hurdat2_file
 from profile_clean import clean_hurdat2_data
+from storm_tract_distance import centroid_to_track_km
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Debug the distance calculation for one tract")
+    parser.add_argument("--plot", action="store_true", help="Save a diagnostic plot of the tract and track")
+    parser.add_argument("--dpi", type=int, default=100, help="Resolution of the saved plot")
+    return parser.parse_args()
+
+
+def plot_distance_debug(tract_geoid, centroid_point, track_line, calculated_dist_km, dpi=100, fig=None):
+    """Save a diagnostic plot of the centroid, track and distance circles.
+
+    Pass ``fig`` to redraw into an existing figure (e.g. when plotting many
+    tracts); it is cleared first and left open for the caller.
+    """
+
+    # A bare Figure renders through Agg on savefig without pyplot's backend
+    # and figure-manager setup; imported only when plotting
+    from matplotlib.figure import Figure
+
+    print("Creating diagnostic plot...")
+    if fig is None:
+        fig = Figure(figsize=(10, 10))
+    else:
+        fig.clf()
+    ax = fig.add_subplot(1, 1, 1)
+    centroid_lon, centroid_lat = centroid_point.x, centroid_point.y
+
+    # Plot track
+    ax.plot(*track_line.xy, color='red', linewidth=2, label='Ida Track')
+
+    # Plot centroid
+    ax.scatter([centroid_lon], [centroid_lat], color='blue', s=50, label=f'Tract {tract_geoid}')
+
+    # Plot circle for calculated distance
+    radius_deg = calculated_dist_km / 111.0
+    circle = centroid_point.buffer(radius_deg)
+    ax.plot(*circle.exterior.xy, color='green', linestyle='--', label=f'Calculated Distance ({calculated_dist_km:.1f} km)')
+
+    # Plot circle for 10km distance
+    radius_10km_deg = 10 / 111.0
+    circle_10km = centroid_point.buffer(radius_10km_deg)
+    ax.plot(*circle_10km.exterior.xy, color='purple', linestyle=':', label='10 km Reference')
+
+    ax.set_title(f"Distance Calculation Debug for Tract {tract_geoid}")
+    ax.set_xlabel("Longitude")
+    ax.set_ylabel("Latitude")
+    ax.legend()
+    ax.grid(True)
+
+    ax.set_xlim(centroid_lon - 1, centroid_lon + 1)
+    ax.set_ylim(centroid_lat - 1, centroid_lat + 1)
+
+    output_path = REPO_ROOT / "06_outputs" / "visuals" / "debug" / "debug_distance_plot.png"
+    fig.savefig(output_path, dpi=dpi)
+    print(f"✅ Diagnostic plot saved to {output_path}")
+
 
 def main():
     """
-    Creates a diagnostic plot to debug the distance calculation for a specific tract.
+    Recomputes the distance for a specific tract, optionally saving a diagnostic plot.
     """
+    args = parse_args()
     print("--- Debugging Distance Calculation ---")
 
     # 1. Define the problematic tract's data
@@ -35,7 +94,7 @@ def main():
 
     # 2. Load Hurricane Ida track data
     print("Loading Hurricane Ida track data...")
-    hurdat_path = REPO_ROOT / "hurdat2" / "input_data" / "hurdat2-atlantic.txt"
+    hurdat_path = REPO_ROOT / "01_data_sources" / "hurdat2" / "input_data" / "hurdat2-atlantic.txt"
     storms = parse_hurdat2_file(hurdat_path)
     cleaned = clean_hurdat2_data(storms)
     ida_track_df = cleaned[
@@ -49,43 +108,14 @@ def main():
     track_line = LineString(track_coords)
 
     # 4. Recalculate distance for verification
-    distance_deg = centroid_point.distance(track_line)
-    recalculated_dist_km = distance_deg * 111.0 
+    centroid_series = gpd.GeoSeries([centroid_point], crs="EPSG:4326")
+    recalculated_dist_km = centroid_to_track_km(centroid_series, track_line).iloc[0]
     print(f"Recalculated Distance (km): {recalculated_dist_km}")
 
-    # 5. Create the plot
-    print("Creating diagnostic plot...")
-    fig, ax = plt.subplots(1, 1, figsize=(10, 10))
-
-    # Plot track
-    gpd.GeoSeries([track_line]).plot(ax=ax, color='red', linewidth=2, label='Ida Track')
+    # 5. Create the plot only when asked; rendering dominates the runtime
+    if args.plot:
+        plot_distance_debug(tract_geoid, centroid_point, track_line, calculated_dist_km, dpi=args.dpi)
 
-    # Plot centroid
-    gpd.GeoSeries([centroid_point]).plot(ax=ax, color='blue', markersize=50, label=f'Tract {tract_geoid}')
-
-    # Plot circle for calculated distance
-    radius_deg = calculated_dist_km / 111.0
-    circle = centroid_point.buffer(radius_deg)
-    gpd.GeoSeries([circle]).plot(ax=ax, facecolor='none', edgecolor='green', linestyle='--', label=f'Calculated Distance ({calculated_dist_km:.1f} km)')
-
-    # Plot circle for 10km distance
-    radius_10km_deg = 10 / 111.0
-    circle_10km = centroid_point.buffer(radius_10km_deg)
-    gpd.GeoSeries([circle_10km]).plot(ax=ax, facecolor='none', edgecolor='purple', linestyle=':', label='10 km Reference')
-
-
-    ax.set_title(f"Distance Calculation Debug for Tract {tract_geoid}")
-    ax.set_xlabel("Longitude")
-    ax.set_ylabel("Latitude")
-    ax.legend()
-    ax.grid(True)
-    
-    ax.set_xlim(centroid_lon - 1, centroid_lon + 1)
-    ax.set_ylim(centroid_lat - 1, centroid_lat + 1)
-
-    output_path = REPO_ROOT / "06_outputs" / "visuals" / "debug" / "debug_distance_plot.png"
-    plt.savefig(output_path, dpi=300)
-    print(f"✅ Diagnostic plot saved to {output_path}")
 
 if __name__ == "__main__":
     main()
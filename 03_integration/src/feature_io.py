@@ -0,0 +1,195 @@
+"""Locate and read the per-storm feature tables in ``06_outputs/ml_ready``.
+
+Batch scripts and ``feature_pipeline.save_features_for_storm`` write each
+storm's features as Parquet; earlier runs produced CSV. These helpers let
+consumers treat both the same way, preferring Parquet when a storm has both.
+A small ``_index.parquet`` summarises every storm file so the dashboard can
+list storms without opening each one.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, Mapping, Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pcsv
+import pyarrow.parquet as pq
+
+# Earlier entries take precedence when a storm has more than one file
+FEATURE_FILE_SUFFIXES = (".parquet", ".csv")
+
+STORM_INDEX_FILENAME = "_index.parquet"
+STORM_INDEX_COLUMNS = ["storm_id", "storm_name", "year", "path", "n_tracts", "duration_max", "distance_max"]
+
+# Columns kept in the combined storm_tract_features table, shared by every
+# writer of that table so the outputs cannot drift apart
+FINAL_COLUMNS = [
+    "storm_name",
+    "tract_geoid",
+    "distance_km",
+    "max_wind_experienced_kt",
+    "duration_in_envelope_hours",
+    "lead_time_cat1_hours",
+    "lead_time_cat2_hours",
+    "lead_time_cat3_hours",
+    "lead_time_cat4_hours",
+]
+
+# Parse types for FINAL_COLUMNS; fixing them up front skips type inference and
+# keeps GEOIDs as strings whether a storm was saved as CSV or Parquet. Storm
+# names repeat on every row, so they are held as categories. GEOIDs stay
+# strings because Alabama's start with a significant leading zero.
+FINAL_COLUMN_DTYPES = {
+    "storm_name": "category",
+    "tract_geoid": str,
+    **{col: "float64" for col in FINAL_COLUMNS[2:]},
+}
+
+
+def existing_storm_features(directory: Path, storm_id: str) -> Path | None:
+    """Return the saved feature file for ``storm_id`` in ``directory``, if any."""
+
+    for suffix in FEATURE_FILE_SUFFIXES:
+        path = Path(directory) / f"{storm_id.lower()}_features{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def find_storm_feature_files(directory: Path) -> list[Path]:
+    """Return one saved feature file per storm in ``directory``, sorted by name."""
+
+    by_storm: dict[str, Path] = {}
+    for suffix in reversed(FEATURE_FILE_SUFFIXES):
+        for path in Path(directory).glob(f"al*_features{suffix}"):
+            by_storm[path.stem] = path
+    return [by_storm[stem] for stem in sorted(by_storm)]
+
+
+def read_storm_features(
+    path: Path,
+    columns: Sequence[str] | None = None,
+    dtype: Mapping[str, object] | None = None,
+) -> pd.DataFrame:
+    """Load a per-storm feature table written as Parquet or CSV.
+
+    When ``columns`` is given only those present in the file are read, so
+    callers that combine many storms never materialise the unused columns.
+    ``dtype`` fixes column types up front (at parse time for CSV) so every
+    storm comes back with the same schema.
+    """
+
+    path = Path(path)
+    wanted = set(columns) if columns is not None else None
+    if path.suffix == ".parquet":
+        if wanted is not None:
+            columns = [col for col in pq.read_schema(path).names if col in wanted]
+        frame = pd.read_parquet(path, columns=columns)
+        if dtype:
+            frame = frame.astype({col: typ for col, typ in dtype.items() if col in frame.columns})
+        return frame
+
+    # The pyarrow engine parses on multiple threads but only takes column names.
+    # It also infers types before applying ``dtype`` (so "01001020100" would be
+    # read as an integer and lose its leading zero); the C engine applies
+    # ``dtype`` while parsing, so it is used whenever types are fixed
+    if wanted is not None:
+        columns = [col for col in pd.read_csv(path, nrows=0).columns if col in wanted]
+    engine = "c" if dtype else "pyarrow"
+    return pd.read_csv(path, engine=engine, usecols=columns, dtype=dtype)
+
+
+def stream_combined_features(
+    frames: Iterable[pd.DataFrame],
+    csv_path: Path,
+    columns: Sequence[str],
+) -> pd.Series:
+    """Write storm frames to ``csv_path`` and a sibling ``.parquet`` one at a time.
+
+    Each frame is appended to both outputs as it arrives, so only one storm is
+    held in memory rather than the concatenated table. Both files are written
+    from the same Arrow table by pyarrow's C++ writers. Returns record counts by
+    ``storm_name``.
+    """
+
+    csv_path = Path(csv_path)
+    counts: dict[str, int] = {}
+    writer = csv_writer = None
+    try:
+        for frame in frames:
+            frame = frame.reindex(columns=list(columns))
+
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(csv_path.with_suffix(".parquet"), table.schema, compression="zstd")
+                csv_writer = pcsv.CSVWriter(csv_path, table.schema)
+            else:
+                # Older CSVs parse GEOIDs as integers; align to the first storm's types
+                table = table.cast(writer.schema)
+            writer.write_table(table)
+            csv_writer.write_table(table)
+
+            for storm, count in frame.groupby("storm_name", observed=True).size().items():
+                counts[storm] = counts.get(storm, 0) + count
+    finally:
+        for open_writer in (writer, csv_writer):
+            if open_writer is not None:
+                open_writer.close()
+
+    return pd.Series(counts, dtype="int64")
+
+
+def build_storm_index(directory: Path) -> pd.DataFrame:
+    """Summarise each storm feature file in ``directory`` as one index row.
+
+    ``path`` is the file name relative to ``directory``. Files without tracts
+    get ``n_tracts == 0``; ``duration_max`` and ``distance_max`` are NaN when
+    there is nothing to summarise.
+    """
+
+    rows = []
+    for path in find_storm_feature_files(directory):
+        frame = read_storm_features(
+            path, columns=["storm_id", "storm_name", "duration_in_envelope_hours", "distance_km"]
+        )
+        has_rows = not frame.empty
+        storm_id = str(frame["storm_id"].iloc[0]) if has_rows and "storm_id" in frame else path.stem.split("_")[0].upper()
+        rows.append({
+            "storm_id": storm_id,
+            "storm_name": str(frame["storm_name"].iloc[0]) if has_rows and "storm_name" in frame else "",
+            "year": storm_id[-4:] if storm_id[-4:].isdigit() else "",
+            "path": path.name,
+            "n_tracts": len(frame),
+            "duration_max": frame["duration_in_envelope_hours"].max() if "duration_in_envelope_hours" in frame else float("nan"),
+            "distance_max": frame["distance_km"].max() if "distance_km" in frame else float("nan"),
+        })
+    return pd.DataFrame(rows, columns=STORM_INDEX_COLUMNS)
+
+
+def write_storm_index(directory: Path) -> Path:
+    """Rebuild ``_index.parquet`` in ``directory`` from its storm feature files."""
+
+    index_path = Path(directory) / STORM_INDEX_FILENAME
+    build_storm_index(directory).to_parquet(index_path, index=False)
+    return index_path
+
+
+def load_storm_index(directory: Path) -> pd.DataFrame:
+    """Return the storm index for ``directory``.
+
+    The saved index is used while it lists exactly the current feature files and
+    is newer than all of them; otherwise the index is rebuilt in memory.
+    """
+
+    index_path = Path(directory) / STORM_INDEX_FILENAME
+    if index_path.exists():
+        index_mtime = index_path.stat().st_mtime
+        feature_files = find_storm_feature_files(directory)
+        index = pd.read_parquet(index_path)
+        if set(index["path"]) == {path.name for path in feature_files} and all(
+            path.stat().st_mtime <= index_mtime for path in feature_files
+        ):
+            return index
+    return build_storm_index(directory)
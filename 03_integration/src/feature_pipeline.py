@@ -3,21 +3,14 @@
 from __future__ import annotations
 
 import argparse
+from functools import lru_cache
 from types import SimpleNamespace
-import sys
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Iterable, Literal, Sequence
 
 import pandas as pd
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-sys.path.extend([
-    str(REPO_ROOT / "01_data_sources" / "hurdat2" / "src"),
-    str(REPO_ROOT / "01_data_sources" / "census" / "src"),
-    str(REPO_ROOT / "02_transformations" / "storm_tract_distance" / "src"),
-    str(REPO_ROOT / "02_transformations" / "lead_time" / "src"),
-    str(REPO_ROOT / "03_integration" / "src"),
-])
+from _pathsetup import REPO_ROOT
 
 try:
     from parse_raw_indexed import parse_storm_by_id, get_or_build_index
@@ -25,7 +18,7 @@ try:
 except ImportError:
     USE_INDEXED_PARSER = False
 
-from parse_raw import parse_hurdat2_file
+from clean_cache import load_clean_hurdat2
 from profile_clean import clean_hurdat2_data
 from intensification_features import calculate_intensification_features
 from storm_tract_distance import run_pipeline as distance_run_pipeline
@@ -33,6 +26,26 @@ from storm_tract_distance import run_pipeline as distance_run_pipeline
 DEFAULT_GULF_STATES = ['22', '28', '48', '01', '12']  # LA, MS, TX, AL, FL
 
 
+@lru_cache(maxsize=4)
+def _load_clean_hurdat(hurdat_data_path: str) -> pd.DataFrame:
+    """Load the cleaned HURDAT2 frame once per path for this process.
+
+    Callers slice storms out of the shared frame and must not modify it.
+    """
+
+    return load_clean_hurdat2(hurdat_data_path)
+
+
+@lru_cache(maxsize=4)
+def _tracks_by_storm(hurdat_data_path: str) -> dict[str, pd.DataFrame]:
+    """Partition the cached HURDAT2 frame into date-sorted tracks keyed by storm ID."""
+
+    return {
+        storm_id: group.sort_values('date').reset_index(drop=True)
+        for storm_id, group in _load_clean_hurdat(hurdat_data_path).groupby('storm_id', sort=False)
+    }
+
+
 def _build_args(
     storm_id: str,
     hurdat_data_path: str,
@@ -58,12 +71,15 @@ def extract_all_features_for_storm(
     census_year: int = 2019,
     gulf_states: Iterable[str] | None = DEFAULT_GULF_STATES,
     bounds_margin: float = 3.0,
+    hurdat_clean: pd.DataFrame | None = None,
 ) -> pd.DataFrame:
     """Return tract-level features for a single hurricane storm.
 
     The function delegates to the modern pipeline implemented in
     ``02_transformations/storm_tract_distance/src/storm_tract_distance.py`` and attaches storm-level
-    intensification metrics for downstream analytics.
+    intensification metrics for downstream analytics. Pass ``hurdat_clean``
+    (a cleaned frame such as ``load_clean_hurdat2`` returns) to slice the
+    storm's track from it instead of reading the HURDAT2 file again.
     """
 
     args = _build_args(
@@ -79,22 +95,23 @@ def extract_all_features_for_storm(
         return features
 
     # Append intensification features (constant per storm) for completeness.
-    # Use indexed parser if available for speed
-    if USE_INDEXED_PARSER:
+    # Use the caller's cleaned frame, else the indexed parser if available for speed
+    if hurdat_clean is not None:
+        track_df = hurdat_clean[hurdat_clean['storm_id'] == storm_id].sort_values('date').reset_index(drop=True)
+        if track_df.empty:
+            raise ValueError(f"Storm {storm_id} not found in cleaned dataset")
+    elif USE_INDEXED_PARSER:
         index = get_or_build_index(hurdat_data_path)
         df_raw = parse_storm_by_id(hurdat_data_path, storm_id, index=index)
         df_clean = clean_hurdat2_data(df_raw)
         track_df = df_clean.sort_values('date').reset_index(drop=True)
     else:
-        df_raw = parse_hurdat2_file(hurdat_data_path)
-        df_clean = clean_hurdat2_data(df_raw)
-        track_df = df_clean[df_clean['storm_id'] == storm_id].sort_values('date').reset_index(drop=True)
-        if track_df.empty:
+        track_df = _tracks_by_storm(str(hurdat_data_path)).get(storm_id)
+        if track_df is None:
             raise ValueError(f"Storm {storm_id} not found in cleaned dataset")
 
     intensification = calculate_intensification_features(track_df)
-    for key, value in intensification.items():
-        features[key] = value
+    features = features.assign(**intensification)
 
     return features
 
@@ -106,8 +123,18 @@ def save_features_for_storm(
     census_year: int = 2019,
     gulf_states: Iterable[str] | None = DEFAULT_GULF_STATES,
     bounds_margin: float = 3.0,
+    fmt: Literal["csv", "parquet"] = "parquet",
+    hurdat_clean: pd.DataFrame | None = None,
 ) -> Path:
-    """Extract features and persist them to ``output_path`` in CSV format."""
+    """Extract features and persist them to ``output_path`` as Parquet or CSV.
+
+    ``output_path`` must carry the suffix matching ``fmt``. CSV remains
+    available for consumers that need text.
+    """
+
+    output_path = Path(output_path)
+    if output_path.suffix != f".{fmt}":
+        raise ValueError(f"output_path {output_path} does not match fmt={fmt!r}")
 
     features = extract_all_features_for_storm(
         storm_id=storm_id,
@@ -115,11 +142,14 @@ def save_features_for_storm(
         census_year=census_year,
         gulf_states=gulf_states,
         bounds_margin=bounds_margin,
+        hurdat_clean=hurdat_clean,
     )
 
-    output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    features.to_csv(output_path, index=False)
+    if fmt == "parquet":
+        features.to_parquet(output_path, index=False, compression="zstd")
+    else:
+        features.to_csv(output_path, index=False)
     return output_path
 
 
@@ -144,18 +174,24 @@ def _parse_cli_args() -> argparse.Namespace:
         default=3.0,
         help="Padding in degrees to expand the track bounding box",
     )
+    parser.add_argument(
+        "--format",
+        choices=["parquet", "csv"],
+        default="parquet",
+        help="Feature file format (must match the --output suffix)",
+    )
     parser.add_argument(
         "--output",
         type=Path,
         default=None,
-        help="Where to write the feature CSV (defaults to 06_outputs/ml_ready/{storm_id}_features.csv)",
+        help="Where to write the feature file (defaults to 06_outputs/ml_ready/{storm_id}_features.<format>)",
     )
     return parser.parse_args()
 
 
 def main() -> None:
     args = _parse_cli_args()
-    default_output = REPO_ROOT / "06_outputs" / "ml_ready" / f"{args.storm_id.lower()}_features.csv"
+    default_output = REPO_ROOT / "06_outputs" / "ml_ready" / f"{args.storm_id.lower()}_features.{args.format}"
     output_path = args.output or default_output
 
     saved_path = save_features_for_storm(
@@ -165,6 +201,7 @@ def main() -> None:
         census_year=args.census_year,
         gulf_states=args.states,
         bounds_margin=args.bounds_margin,
+        fmt=args.format,
     )
 
     print(f"✅ Saved {args.storm_id} features to {saved_path}")
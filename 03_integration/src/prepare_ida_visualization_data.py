@@ -1,7 +1,7 @@
 import sys
 from pathlib import Path
 import pandas as pd
-from shapely.geometry import Point, LineString
+from shapely.geometry import LineString
 
 # Add project src path to allow importing modules
 REPO_ROOT = Path(__file__).resolve().parents[2]
@@ -9,12 +9,14 @@ sys.path.extend(
     [
         str(REPO_ROOT / "01_data_sources" / "census" / "src"),
         str(REPO_ROOT / "01_data_sources" / "hurdat2" / "src"),
+        str(REPO_ROOT / "02_transformations" / "storm_tract_distance" / "src"),
     ]
 )
 
 from tract_centroids import load_tracts_with_centroids
 from parse_raw import parse_hurdat2_file
 from profile_clean import clean_hurdat2_data
+from storm_tract_distance import centroid_to_track_km
 
 def main():
     """
@@ -30,8 +32,8 @@ def main():
         return
     tract_pairs = pd.read_csv(tract_pairs_path)
     tract_pairs['tract_geoid'] = tract_pairs['tract_geoid'].astype(str)
-    affected_geoids = tract_pairs['tract_geoid'].tolist()
-    print(f"Loaded {len(affected_geoids)} affected tract GEOIDs.")
+    affected_geoids = set(tract_pairs['tract_geoid'])
+    print(f"Loaded {len(tract_pairs)} affected tract GEOIDs.")
 
     # 2. Load census tract centroids
     print("Loading census tract centroids...")
@@ -49,7 +51,7 @@ def main():
 
     # 3. Load Hurricane Ida track data
     print("Loading Hurricane Ida track data...")
-    hurdat_path = REPO_ROOT / "hurdat2" / "input_data" / "hurdat2-atlantic.txt"
+    hurdat_path = REPO_ROOT / "01_data_sources" / "hurdat2" / "input_data" / "hurdat2-atlantic.txt"
     storms = parse_hurdat2_file(hurdat_path)
     cleaned = clean_hurdat2_data(storms)
     ida_track = cleaned[
@@ -63,14 +65,8 @@ def main():
     track_coords = list(zip(ida_track['lon'], ida_track['lat']))
     track_line = LineString(track_coords)
 
-    distances_km = []
-    for idx, row in affected_centroids.iterrows():
-        centroid_point = Point(row.geometry.x, row.geometry.y)
-        distance_deg = centroid_point.distance(track_line)
-        distance_km = distance_deg * 111.0  # Approximate conversion
-        distances_km.append(distance_km)
-    
-    affected_centroids['distance_to_track_km'] = distances_km
+    # One vectorised GEOS call over all centroids, in projected metres
+    affected_centroids['distance_to_track_km'] = centroid_to_track_km(affected_centroids.geometry, track_line)
     print("Distance calculation complete.")
 
     # 5. Create enriched CSV
@@ -78,9 +74,13 @@ def main():
     affected_centroids['centroid_lon'] = affected_centroids.geometry.x
     affected_centroids['centroid_lat'] = affected_centroids.geometry.y
 
-    affected_centroids.rename(columns={'GEOID': 'tract_geoid'}, inplace=True)
-    
-    vis_data = pd.merge(tract_pairs, affected_centroids, on='tract_geoid')
+    # Join on GEOID indexes (same inner semantics and suffixes as merge)
+    vis_data = (
+        tract_pairs.set_index('tract_geoid')
+        .join(affected_centroids.set_index('GEOID'), how='inner', lsuffix='_x', rsuffix='_y')
+        .rename_axis('tract_geoid')
+        .reset_index()
+    )
 
     output_columns = [
         'storm_id',
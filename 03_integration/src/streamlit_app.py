@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+import io
+import multiprocessing
+import os
 import sys
 from dataclasses import dataclass
 from pathlib import Path
+from multiprocessing.pool import AsyncResult
 from typing import Dict, List, Optional
 
 import folium
+import numpy as np
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
+import shapely
 import streamlit as st
+import streamlit.components.v1 as components
 from branca.colormap import linear
-from shapely.geometry import LineString
-from streamlit_folium import st_folium
+from shapely.geometry import LineString, MultiPolygon, Polygon
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 sys.path.extend(
@@ -24,12 +31,22 @@ sys.path.extend(
     ]
 )
 
-from parse_raw import parse_hurdat2_file  # noqa: E402
-from profile_clean import clean_hurdat2_data  # noqa: E402
-from storm_tract_distance import create_wind_coverage_envelope  # noqa: E402
+from clean_cache import load_clean_hurdat2  # noqa: E402
+from storm_tract_distance import load_wind_coverage_envelope  # noqa: E402
+from feature_io import load_storm_index  # noqa: E402
 
 OUTPUT_DIR = REPO_ROOT / "06_outputs" / "ml_ready"
 HURDAT_PATH = REPO_ROOT / "01_data_sources" / "hurdat2" / "input_data" / "hurdat2-atlantic.txt"
+COLOR_LUT_SIZE = 256
+MAP_HEIGHT = 500
+
+# Hash map inputs by content: frames by row hashes, geometries by WKB
+_MAP_HASH_FUNCS = {
+    pd.DataFrame: lambda df: pd.util.hash_pandas_object(df, index=False).values.tobytes(),
+    LineString: lambda geom: geom.wkb,
+    Polygon: lambda geom: geom.wkb,
+    MultiPolygon: lambda geom: geom.wkb,
+}
 
 
 @dataclass(frozen=True)
@@ -39,67 +56,144 @@ class StormOption:
     storm_id: str
     storm_name: str
     year: str
+    duration_max: float = 0.0
+    distance_max: float = 0.0
 
 
 @st.cache_data(show_spinner=False)
 def discover_storm_files() -> List[StormOption]:
-    """Return available storm feature files with parsed metadata."""
+    """Return available storm feature files with parsed metadata from the storm index."""
 
     options: List[StormOption] = []
     if not OUTPUT_DIR.exists():
         return options
 
-    for csv_path in sorted(OUTPUT_DIR.glob("*_features*.csv")):
-        try:
-            head = pd.read_csv(csv_path, nrows=1)
-        except Exception:
-            continue
-        if head.empty:
-            continue
-
-        row = head.iloc[0]
-        storm_id = str(row.get("storm_id", "")).strip()
-        storm_name = str(row.get("storm_name", "")).strip().title() or csv_path.stem
-        year = ""
-        if len(storm_id) >= 4 and storm_id[-4:].isdigit():
-            year = storm_id[-4:]
+    index = load_storm_index(OUTPUT_DIR)
+    for row in index[index["n_tracts"] > 0].itertuples(index=False):
+        storm_id = row.storm_id.strip()
+        storm_name = row.storm_name.strip().title() or Path(row.path).stem
+        year = row.year
         label = f"{storm_name} ({storm_id})" + (f" – {year}" if year else "")
-        options.append(StormOption(label=label, path=csv_path, storm_id=storm_id, storm_name=storm_name, year=year))
+        options.append(
+            StormOption(
+                label=label,
+                path=OUTPUT_DIR / row.path,
+                storm_id=storm_id,
+                storm_name=storm_name,
+                year=year,
+                duration_max=float(np.nan_to_num(row.duration_max)),
+                distance_max=float(np.nan_to_num(row.distance_max)),
+            )
+        )
 
     return options
 
 
-@st.cache_data(show_spinner=False)
-def load_features(csv_path: Path) -> pd.DataFrame:
-    """Load features for selected storm."""
+@st.cache_data(show_spinner=False, persist="disk", max_entries=64)
+def load_features(csv_path: Path, mtime: Optional[float] = None) -> pd.DataFrame:
+    """Load features for selected storm.
 
-    df = pd.read_csv(csv_path)
-    # Ensure datetime columns parsed for analytics
+    ``mtime`` only keys the cache, so a regenerated file is re-read even though
+    cached frames persist on disk across restarts.
+    """
+
+    if csv_path.suffix == ".parquet":
+        df = pd.read_parquet(csv_path)
+    else:
+        df = pd.read_csv(csv_path)
+    # Ensure datetime columns parsed for analytics (Parquet usually keeps them);
+    # the ETL writes ISO timestamps, so skip per-value format inference
     for col in ["storm_time", "first_entry_time", "last_exit_time"]:
-        if col in df.columns:
-            df[col] = pd.to_datetime(df[col], errors="coerce")
+        if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = pd.to_datetime(df[col], errors="coerce", format="ISO8601", cache=True)
+    # Zero-pad state FIPS once into a categorical so filters compare category codes
+    if "STATEFP" in df.columns:
+        df["STATEFP"] = (
+            pd.to_numeric(df["STATEFP"], errors="coerce").astype("Int64").astype("string").str.zfill(2).astype("category")
+        )
     return df
 
 
 @st.cache_data(show_spinner=False)
 def load_hurdat() -> pd.DataFrame:
-    """Load and clean HURDAT2 dataset once."""
+    """Load and clean HURDAT2 dataset once.
+
+    Cold starts read the shared Parquet copy of the cleaned frame instead of
+    re-parsing the text file.
+    """
+
+    return load_clean_hurdat2(HURDAT_PATH)
+
+
+@st.cache_resource(show_spinner=False)
+def load_storm_tracks() -> Dict[str, pd.DataFrame]:
+    """Partition HURDAT2 into date-ordered tracks keyed by storm ID, once per server.
+
+    Shared across reruns; callers must not modify the frames in place.
+    """
+
+    return {
+        storm_id: group.sort_values("date").reset_index(drop=True)
+        for storm_id, group in load_hurdat().groupby("storm_id", sort=False)
+    }
+
 
-    raw = parse_hurdat2_file(str(HURDAT_PATH))
-    return clean_hurdat2_data(raw)
+def _storm_track(storm_id: str) -> pd.DataFrame:
+    """Return the date-ordered HURDAT2 track for one storm (empty when unknown)."""
+
+    track_df = load_storm_tracks().get(storm_id)
+    return pd.DataFrame() if track_df is None else track_df
+
+
+@st.cache_resource(show_spinner=False)
+def prefetch_envelopes() -> Dict[str, AsyncResult]:
+    """Start building every listed storm's envelope in background processes.
+
+    Envelopes are independent per storm, so they are submitted to a process
+    pool once per server; selecting a storm then usually just collects a
+    finished result. Workers go through the on-disk envelope cache, so later
+    restarts skip the geometry work entirely.
+
+    Workers are spawned rather than forked from the threaded server. They
+    are daemon processes that multiprocessing terminates at interpreter
+    exit, so stopping the server does not wait for queued envelopes.
+    """
+
+    pool = multiprocessing.get_context("spawn").Pool(processes=max(1, (os.cpu_count() or 2) // 2))
+    results = {}
+    for option in discover_storm_files():
+        track_df = _storm_track(option.storm_id)
+        if not track_df.empty:
+            results[option.storm_id] = pool.apply_async(
+                load_wind_coverage_envelope, (track_df, option.storm_id, "64kt", 15)
+            )
+    # Submitted envelopes still finish; the pool just stops accepting work
+    pool.close()
+    return results
 
 
 @st.cache_data(show_spinner=False)
 def compute_track_and_envelope(storm_id: str) -> Dict[str, Optional[object]]:
-    """Return track dataframe, coverage envelope, and track line for the storm."""
+    """Return track dataframe, coverage envelope, track line and envelope spatial index for the storm.
 
-    hurdat = load_hurdat()
-    track_df = hurdat[hurdat["storm_id"] == storm_id].sort_values("date").reset_index(drop=True)
+    The coverage polygon is prepared with ``shapely.prepare``. Cache hits hand
+    back unpickled copies without that state, so consumers re-prepare as needed.
+    """
+
+    track_df = _storm_track(storm_id)
     if track_df.empty:
-        return {"track_df": None, "coverage": None, "track_line": None}
+        return {"track_df": None, "coverage": None, "track_line": None, "sindex": None}
 
-    coverage, track_line, _ = create_wind_coverage_envelope(track_df, wind_threshold="64kt", interval_minutes=15)
-    return {"track_df": track_df, "coverage": coverage, "track_line": track_line}
+    pending = prefetch_envelopes().get(storm_id)
+    if pending is not None:
+        coverage, track_line = pending.get()
+    else:
+        coverage, track_line = load_wind_coverage_envelope(track_df, storm_id, wind_threshold="64kt", interval_minutes=15)
+    sindex = None
+    if coverage is not None:
+        shapely.prepare(coverage)
+        sindex = shapely.STRtree([coverage])
+    return {"track_df": track_df, "coverage": coverage, "track_line": track_line, "sindex": sindex}
 
 
 def summarise_features(df: pd.DataFrame) -> Dict[str, str]:
@@ -108,27 +202,39 @@ def summarise_features(df: pd.DataFrame) -> Dict[str, str]:
     summary: Dict[str, str] = {
         "Affected Tracts": f"{len(df):,}",
     }
-    if "duration_in_envelope_hours" in df.columns and not df.empty:
-        durations = df["duration_in_envelope_hours"].dropna()
-        summary["Duration Range"] = (
-            f"{durations.min():.1f} – {durations.max():.1f} hrs" if not durations.empty else "N/A"
-        )
-        summary["Mean Duration"] = f"{durations.mean():.1f} hrs" if not durations.empty else "N/A"
-    if "distance_km" in df.columns and not df.empty:
-        distances = df["distance_km"].dropna()
-        summary["Distance Range"] = (
-            f"{distances.min():.1f} – {distances.max():.1f} km" if not distances.empty else "N/A"
-        )
-    if "max_wind_experienced_kt" in df.columns and not df.empty:
-        summary["Max Wind"] = f"{df['max_wind_experienced_kt'].max():.0f} kt"
-    if "STATEFP" in df.columns and not df.empty:
-        states = sorted({str(s).zfill(2) for s in df["STATEFP"].dropna()})
+    if df.empty:
+        return summary
+
+    # Resolve every metric in one aggregation pass; min/max/mean skip missing values
+    agg_spec = {
+        col: funcs
+        for col, funcs in {
+            "duration_in_envelope_hours": ["min", "max", "mean"],
+            "distance_km": ["min", "max"],
+            "max_wind_experienced_kt": ["max"],
+            "storm_time": ["min", "max"],
+        }.items()
+        if col in df.columns
+    }
+    stats = df.agg(agg_spec) if agg_spec else pd.DataFrame()
+
+    if "duration_in_envelope_hours" in stats:
+        low, high, mean = stats["duration_in_envelope_hours"].loc[["min", "max", "mean"]]
+        summary["Duration Range"] = f"{low:.1f} – {high:.1f} hrs" if not pd.isna(low) else "N/A"
+        summary["Mean Duration"] = f"{mean:.1f} hrs" if not pd.isna(mean) else "N/A"
+    if "distance_km" in stats:
+        low, high = stats["distance_km"].loc[["min", "max"]]
+        summary["Distance Range"] = f"{low:.1f} – {high:.1f} km" if not pd.isna(low) else "N/A"
+    if "max_wind_experienced_kt" in stats:
+        summary["Max Wind"] = f"{stats.at['max', 'max_wind_experienced_kt']:.0f} kt"
+    if "STATEFP" in df.columns:
+        states = df["STATEFP"].cat.remove_unused_categories().cat.categories.sort_values().tolist()
         summary["States"] = ", ".join(states) if states else "N/A"
-    if "storm_time" in df.columns and not df.empty:
-        storm_times = df["storm_time"].dropna().sort_values()
-        if not storm_times.empty:
-            summary["First Observation"] = storm_times.iloc[0].strftime("%Y-%m-%d %H:%M")
-            summary["Last Observation"] = storm_times.iloc[-1].strftime("%Y-%m-%d %H:%M")
+    if "storm_time" in stats:
+        first, last = stats["storm_time"].loc[["min", "max"]]
+        if not pd.isna(first):
+            summary["First Observation"] = first.strftime("%Y-%m-%d %H:%M")
+            summary["Last Observation"] = last.strftime("%Y-%m-%d %H:%M")
     return summary
 
 
@@ -137,17 +243,79 @@ def apply_filters(
     min_duration: float,
     max_distance: float,
     selected_states: List[str],
+    coverage_index: Optional[shapely.STRtree] = None,
 ) -> pd.DataFrame:
-    """Filter feature dataframe based on user controls."""
-
-    filtered = df.copy()
-    if "duration_in_envelope_hours" in filtered.columns:
-        filtered = filtered[filtered["duration_in_envelope_hours"] >= min_duration]
-    if "distance_km" in filtered.columns:
-        filtered = filtered[filtered["distance_km"] <= max_distance]
+    """Filter feature dataframe based on user controls.
+
+    When ``coverage_index`` is given, only centroids intersecting the indexed
+    coverage envelope are kept: the tree prunes by bounding box and the exact
+    test runs against the prepared envelope.
+    """
+
+    # Fuse every condition into one mask so only the final selection is copied;
+    # the original index is kept because no consumer needs a RangeIndex
+    mask = np.ones(len(df), dtype=bool)
+    if "duration_in_envelope_hours" in df.columns:
+        mask &= df["duration_in_envelope_hours"].to_numpy() >= min_duration
+    if "distance_km" in df.columns:
+        mask &= df["distance_km"].to_numpy() <= max_distance
     if selected_states:
-        filtered = filtered[filtered["STATEFP"].astype(str).str.zfill(2).isin(selected_states)]
-    return filtered.reset_index(drop=True)
+        mask &= df["STATEFP"].isin(selected_states).to_numpy()
+    if coverage_index is not None and {"centroid_lon", "centroid_lat"} <= set(df.columns):
+        points = shapely.points(df["centroid_lon"].to_numpy(), df["centroid_lat"].to_numpy())
+        envelopes = coverage_index.geometries
+        shapely.prepare(envelopes)
+        point_idx, envelope_idx = coverage_index.query(points)
+        hits = shapely.intersects(envelopes[envelope_idx], points[point_idx])
+        inside = np.zeros(len(df), dtype=bool)
+        inside[point_idx[hits]] = True
+        mask &= inside
+    return df.loc[mask]
+
+
+def _centroid_feature_collection(df: pd.DataFrame, colormap) -> Dict[str, object]:
+    """Build a GeoJSON FeatureCollection of tract centroids with colour, tooltip and popup HTML."""
+
+    missing = pd.Series(float("nan"), index=df.index)
+    distances = df["distance_km"].to_numpy(dtype=float)
+    # Sample the colormap once into a 256-entry lookup table instead of
+    # interpolating per tract
+    bins = np.linspace(colormap.vmin, colormap.vmax, COLOR_LUT_SIZE)
+    lut = np.array([colormap(value) for value in bins], dtype=object)
+    colors = lut[np.searchsorted(bins, np.nan_to_num(distances)).clip(0, COLOR_LUT_SIZE - 1)]
+    colors[np.isnan(distances)] = "#cccccc"
+    tooltips = [
+        f"<b>Tract:</b> {geoid}<br>"
+        f"<b>Distance:</b> {distance:.1f} km<br>"
+        f"<b>Duration:</b> {duration:.1f} hrs<br>"
+        f"<b>Max Wind:</b> {wind:.1f} kt"
+        for geoid, distance, duration, wind in zip(
+            df.get("tract_geoid", pd.Series(None, index=df.index)),
+            distances,
+            df.get("duration_in_envelope_hours", missing),
+            df.get("max_wind_experienced_kt", missing),
+        )
+    ]
+    # Assemble popup HTML column by column with vectorised string ops; every
+    # non-missing field starts with "<br>", so the leading one is sliced off
+    popups = pd.Series("", index=df.index)
+    for col in df.columns:
+        values = df[col]
+        popups += ("<br><b>" + str(col) + ":</b> " + values.astype(str)).where(values.notna(), "")
+    popups = popups.str[len("<br>"):]
+    coordinates = zip(df["centroid_lon"].to_numpy(dtype=float), df["centroid_lat"].to_numpy(dtype=float))
+
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [lon, lat]},
+                "properties": {"color": color, "tooltip": tooltip, "popup": popup},
+            }
+            for (lon, lat), color, tooltip, popup in zip(coordinates, colors, tooltips, popups)
+        ],
+    }
 
 
 def build_map(
@@ -165,7 +333,9 @@ def build_map(
 
     lat_center = df["centroid_lat"].mean()
     lon_center = df["centroid_lon"].mean()
-    fmap = folium.Map(location=[lat_center, lon_center], zoom_start=6, tiles="cartodbpositron")
+    # Paint vector layers on one canvas so thousands of centroid circles are a
+    # single draw pass instead of one SVG element each
+    fmap = folium.Map(location=[lat_center, lon_center], zoom_start=6, tiles="cartodbpositron", prefer_canvas=True)
 
     if show_envelope and coverage is not None:
         folium.GeoJson(
@@ -189,7 +359,6 @@ def build_map(
         ).add_to(fmap)
 
     if show_centroids:
-        centroid_layer = folium.FeatureGroup(name="Tract Centroids", show=True)
         distances = df["distance_km"].clip(lower=0)
         if distances.empty:
             distances = pd.Series([0])
@@ -197,32 +366,62 @@ def build_map(
         colormap.caption = "Distance to Track (km)"
         colormap.add_to(fmap)
 
-        for _, row in df.iterrows():
-            color = colormap(row.get("distance_km", 0)) if not pd.isna(row.get("distance_km")) else "#cccccc"
-            tooltip = (
-                f"<b>Tract:</b> {row.get('tract_geoid')}<br>"
-                f"<b>Distance:</b> {row.get('distance_km', float('nan')):.1f} km<br>"
-                f"<b>Duration:</b> {row.get('duration_in_envelope_hours', float('nan')):.1f} hrs<br>"
-                f"<b>Max Wind:</b> {row.get('max_wind_experienced_kt', float('nan')):.1f} kt"
-            )
-            popup_fields = row.dropna()
-            popup_html = "<br>".join(f"<b>{col}:</b> {val}" for col, val in popup_fields.items())
-            folium.CircleMarker(
-                location=[row["centroid_lat"], row["centroid_lon"]],
-                radius=4,
-                color=color,
-                fill=True,
-                fill_color=color,
-                fill_opacity=0.8,
-                tooltip=tooltip,
-                popup=folium.Popup(popup_html, max_width=300),
-            ).add_to(centroid_layer)
-        centroid_layer.add_to(fmap)
+        # One GeoJson layer for all tracts: folium renders a single template
+        # instead of one CircleMarker per row
+        folium.GeoJson(
+            _centroid_feature_collection(df, colormap),
+            name="Tract Centroids",
+            show=True,
+            marker=folium.CircleMarker(radius=4, fill=True, fill_opacity=0.8),
+            style_function=lambda feature: {
+                "color": feature["properties"]["color"],
+                "fillColor": feature["properties"]["color"],
+            },
+            tooltip=folium.GeoJsonTooltip(fields=["tooltip"], labels=False),
+            popup=folium.GeoJsonPopup(fields=["popup"], labels=False, max_width=300),
+        ).add_to(fmap)
 
     folium.LayerControl().add_to(fmap)
     return fmap
 
 
+@st.cache_data(show_spinner=False, max_entries=8, hash_funcs=_MAP_HASH_FUNCS)
+def render_map_html(
+    df: pd.DataFrame,
+    coverage,
+    track_line: Optional[LineString],
+    show_envelope: bool,
+    show_track: bool,
+    show_centroids: bool,
+) -> Optional[str]:
+    """Return the rendered HTML for :func:`build_map`, reused across reruns with the same inputs."""
+
+    fmap = build_map(
+        df,
+        coverage=coverage,
+        track_line=track_line,
+        show_envelope=show_envelope,
+        show_track=show_track,
+        show_centroids=show_centroids,
+    )
+    return None if fmap is None else fmap.get_root().render()
+
+
+def _histogram_figure(values: pd.Series, title: str, bins: int = 30, bargap: float = 0.0) -> go.Figure:
+    """Bin ``values`` with NumPy and return a bar chart of the counts.
+
+    Only the bin counts reach the browser, instead of every raw value that
+    ``px.histogram`` would ship for client-side binning.
+    """
+
+    counts, edges = np.histogram(values.dropna().to_numpy(dtype=float), bins=bins)
+    fig = go.Figure(
+        go.Bar(x=0.5 * (edges[:-1] + edges[1:]), y=counts, width=np.diff(edges) * (1 - bargap))
+    )
+    fig.update_layout(title=title, xaxis_title=values.name, yaxis_title="count")
+    return fig
+
+
 def render_charts(df: pd.DataFrame, storm_label: str) -> None:
     """Render Plotly insight charts within tabs."""
 
@@ -239,8 +438,7 @@ def render_charts(df: pd.DataFrame, storm_label: str) -> None:
 
     with tabs[0]:
         if "duration_in_envelope_hours" in df:
-            fig = px.histogram(df, x="duration_in_envelope_hours", nbins=30, title="Duration Distribution (hours)")
-            fig.update_layout(bargap=0.1)
+            fig = _histogram_figure(df["duration_in_envelope_hours"], "Duration Distribution (hours)", bargap=0.1)
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.write("Duration data unavailable.")
@@ -261,7 +459,7 @@ def render_charts(df: pd.DataFrame, storm_label: str) -> None:
 
     with tabs[2]:
         if "max_wind_experienced_kt" in df:
-            fig = px.histogram(df, x="max_wind_experienced_kt", nbins=30, title="Max Wind Experienced (kt)")
+            fig = _histogram_figure(df["max_wind_experienced_kt"], "Max Wind Experienced (kt)")
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.write("Max wind data unavailable.")
@@ -294,19 +492,23 @@ def main() -> None:
 
     storm_options = discover_storm_files()
     if not storm_options:
-        st.error("No feature CSV files found under 06_outputs/ml_ready/. Run the ETL pipeline first.")
+        st.error("No feature files found under 06_outputs/ml_ready/. Run the ETL pipeline first.")
         return
 
-    option_labels = [opt.label for opt in storm_options]
+    prefetch_envelopes()
+
+    options_by_label = {opt.label: opt for opt in storm_options}
+    option_labels = list(options_by_label)
     default_index = 0
     selected_label = st.sidebar.selectbox("Select Hurricane", option_labels, index=default_index)
-    selected_option = next(opt for opt in storm_options if opt.label == selected_label)
+    selected_option = options_by_label[selected_label]
 
     st.sidebar.markdown("### Filters")
-    features_df = load_features(selected_option.path)
+    features_df = load_features(selected_option.path, selected_option.path.stat().st_mtime)
 
-    duration_max = float(features_df.get("duration_in_envelope_hours", pd.Series([0])).max() or 0) or 0.0
-    distance_max = float(features_df.get("distance_km", pd.Series([0])).max() or 0) or 0.0
+    # Slider ranges come from the storm index, not the loaded frame
+    duration_max = selected_option.duration_max
+    distance_max = selected_option.distance_max
 
     min_duration = st.sidebar.slider(
         "Minimum Duration (hrs)",
@@ -323,7 +525,7 @@ def main() -> None:
         step=1.0,
     )
 
-    available_states = sorted({str(s).zfill(2) for s in features_df.get("STATEFP", pd.Series([])).dropna()})
+    available_states = sorted(features_df.get("STATEFP", pd.Series([], dtype="category")).dropna().unique())
     selected_states = st.sidebar.multiselect("Filter by State FIPS", options=available_states)
 
     st.sidebar.markdown("### Map Layers")
@@ -331,7 +533,14 @@ def main() -> None:
     show_track = st.sidebar.checkbox("Storm Track", value=True)
     show_centroids = st.sidebar.checkbox("Tract Centroids", value=True)
 
-    filtered_df = apply_filters(features_df, min_duration=min_duration, max_distance=max_distance, selected_states=selected_states)
+    track_assets = compute_track_and_envelope(selected_option.storm_id)
+    filtered_df = apply_filters(
+        features_df,
+        min_duration=min_duration,
+        max_distance=max_distance,
+        selected_states=selected_states,
+        coverage_index=track_assets.get("sindex") if show_envelope else None,
+    )
 
     summary = summarise_features(filtered_df)
     summary_cols = st.columns(min(4, len(summary))) if summary else []
@@ -339,19 +548,28 @@ def main() -> None:
         col.metric(label, value)
 
     with st.expander("Download Data", expanded=False):
-        csv_bytes = filtered_df.to_csv(index=False).encode("utf-8")
+        # Serialise straight into byte buffers rather than via an intermediate str
+        csv_buffer = io.BytesIO()
+        filtered_df.to_csv(csv_buffer, index=False, encoding="utf-8")
         st.download_button(
             label="Download filtered CSV",
-            data=csv_bytes,
+            data=csv_buffer.getvalue(),
             file_name=f"{selected_option.storm_id.lower()}_features_filtered.csv",
             mime="text/csv",
         )
+        parquet_buffer = io.BytesIO()
+        filtered_df.to_parquet(parquet_buffer, index=False, compression="zstd")
+        st.download_button(
+            label="Download filtered Parquet",
+            data=parquet_buffer.getvalue(),
+            file_name=f"{selected_option.storm_id.lower()}_features_filtered.parquet",
+            mime="application/vnd.apache.parquet",
+        )
 
-    track_assets = compute_track_and_envelope(selected_option.storm_id)
     map_container = st.container()
     with map_container:
         st.subheader("Interactive Map")
-        fmap = build_map(
+        map_html = render_map_html(
             filtered_df,
             coverage=track_assets.get("coverage"),
             track_line=track_assets.get("track_line"),
@@ -359,10 +577,10 @@ def main() -> None:
             show_track=show_track,
             show_centroids=show_centroids,
         )
-        if fmap is None:
+        if map_html is None:
             st.info("Insufficient data to render the map with current filters.")
         else:
-            st_folium(fmap, width=None, height=500, returned_objects=[], key=f"map-{selected_option.storm_id}")
+            components.html(map_html, height=MAP_HEIGHT)
 
     st.subheader("Analytical Views")
     render_charts(filtered_df, storm_label=selected_option.label)
@@ -3,10 +3,71 @@ Shared Geometry Utilities
 
 Common geospatial calculations used across transformations.
 All functions use WGS84 (EPSG:4326) coordinates.
+
+Each calculation has a ``*_vec`` form built on NumPy ufuncs that accepts
+scalars or arrays (broadcast together), so batches of points are computed in
+one call. The scalar functions wrap them for existing callers.
 """
-import math
 from typing import Tuple
 
+import numpy as np
+
+R_NM = 3440.065  # Earth radius in nautical miles
+
+
+def calculate_destination_point_vec(lat, lon, bearing, distance_nm) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorised :func:`calculate_destination_point`.
+
+    Returns:
+        tuple: (dest_lon, dest_lat) arrays in decimal degrees
+    """
+    lat_rad = np.radians(lat)
+    bearing_rad = np.radians(bearing)
+    angular_distance = np.asarray(distance_nm, dtype=float) / R_NM
+
+    # Each sine/cosine is evaluated once and reused, so a batch call makes
+    # only the temporaries the formula actually needs
+    sin_lat, cos_lat = np.sin(lat_rad), np.cos(lat_rad)
+    sin_dist, cos_dist = np.sin(angular_distance), np.cos(angular_distance)
+    sin_dest_lat = sin_lat * cos_dist + cos_lat * sin_dist * np.cos(bearing_rad)
+
+    dest_lat = np.degrees(np.arcsin(sin_dest_lat))
+    dest_lon = np.add(lon, np.degrees(np.arctan2(
+        np.sin(bearing_rad) * sin_dist * cos_lat,
+        cos_dist - sin_lat * sin_dest_lat,
+    )))
+
+    return dest_lon, dest_lat
+
+
+def haversine_distance_vec(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Vectorised :func:`haversine_distance`, in nautical miles."""
+    lat1_rad = np.radians(lat1)
+    lat2_rad = np.radians(lat2)
+    delta_lat = np.radians(np.subtract(lat2, lat1))
+    delta_lon = np.radians(np.subtract(lon2, lon1))
+
+    a = (np.sin(delta_lat / 2) ** 2 +
+         np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(delta_lon / 2) ** 2)
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+    return R_NM * c
+
+
+def calculate_bearing_vec(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Vectorised :func:`calculate_bearing`, in degrees (0-360)."""
+    lat1_rad = np.radians(lat1)
+    lat2_rad = np.radians(lat2)
+    delta_lon = np.radians(np.subtract(lon2, lon1))
+
+    x = np.sin(delta_lon) * np.cos(lat2_rad)
+    y = (np.cos(lat1_rad) * np.sin(lat2_rad) -
+         np.sin(lat1_rad) * np.cos(lat2_rad) * np.cos(delta_lon))
+
+    bearing_deg = np.degrees(np.arctan2(x, y))
+
+    return (bearing_deg + 360) % 360
+
 
 def calculate_destination_point(lat: float, lon: float, bearing: float, distance_nm: float) -> Tuple[float, float]:
     """Great-circle forward calculation using nautical miles.
@@ -27,25 +88,8 @@ def calculate_destination_point(lat: float, lon: float, bearing: float, distance
         >>> calculate_destination_point(29.0, -90.0, 45, 50)
         (-89.409..., 29.589...)
     """
-    R_NM = 3440.065  # Earth radius in nautical miles
-
-    lat_rad = math.radians(lat)
-    lon_rad = math.radians(lon)
-    bearing_rad = math.radians(bearing)
-
-    angular_distance = distance_nm / R_NM
-
-    dest_lat_rad = math.asin(
-        math.sin(lat_rad) * math.cos(angular_distance) +
-        math.cos(lat_rad) * math.sin(angular_distance) * math.cos(bearing_rad)
-    )
-
-    dest_lon_rad = lon_rad + math.atan2(
-        math.sin(bearing_rad) * math.sin(angular_distance) * math.cos(lat_rad),
-        math.cos(angular_distance) - math.sin(lat_rad) * math.sin(dest_lat_rad)
-    )
-
-    return (math.degrees(dest_lon_rad), math.degrees(dest_lat_rad))
+    dest_lon, dest_lat = calculate_destination_point_vec(lat, lon, bearing, distance_nm)
+    return (float(dest_lon), float(dest_lat))
 
 
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -58,18 +102,7 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     Returns:
         float: Distance in nautical miles
     """
-    R_NM = 3440.065  # Earth radius in nautical miles
-
-    lat1_rad = math.radians(lat1)
-    lat2_rad = math.radians(lat2)
-    delta_lat = math.radians(lat2 - lat1)
-    delta_lon = math.radians(lon2 - lon1)
-
-    a = (math.sin(delta_lat / 2) ** 2 +
-         math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2)
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-
-    return R_NM * c
+    return float(haversine_distance_vec(lat1, lon1, lat2, lon2))
 
 
 def calculate_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -82,15 +115,4 @@ def calculate_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> flo
     Returns:
         float: Initial bearing in degrees (0-360)
     """
-    lat1_rad = math.radians(lat1)
-    lat2_rad = math.radians(lat2)
-    delta_lon = math.radians(lon2 - lon1)
-
-    x = math.sin(delta_lon) * math.cos(lat2_rad)
-    y = (math.cos(lat1_rad) * math.sin(lat2_rad) -
-         math.sin(lat1_rad) * math.cos(lat2_rad) * math.cos(delta_lon))
-
-    bearing_rad = math.atan2(x, y)
-    bearing_deg = math.degrees(bearing_rad)
-
-    return (bearing_deg + 360) % 360
+    return float(calculate_bearing_vec(lat1, lon1, lat2, lon2))
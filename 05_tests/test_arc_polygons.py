@@ -3,6 +3,7 @@
 import sys
 from pathlib import Path
 
+import numpy as np
 from shapely.geometry import Polygon
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -10,7 +11,7 @@ sys.path.insert(0, str(REPO_ROOT / "02_transformations" / "duration" / "src"))
 sys.path.insert(0, str(REPO_ROOT / "02_transformations" / "wind_coverage_envelope" / "src"))
 
 from duration_calculator import create_instantaneous_wind_polygon
-from envelope_algorithm import calculate_destination_point
+from envelope_algorithm import calculate_destination_point, generate_quadrant_arc_points
 
 
 def _build_chord_polygon(lat: float, lon: float, radii):
@@ -72,3 +73,12 @@ def test_single_quadrant_fallback_produces_area():
 
     assert arc_poly is not None
     assert arc_poly.area > 0.0
+
+
+def test_quadrant_arc_points_match_scalar_projection():
+    lat, lon = 29.0, -90.0
+    points = generate_quadrant_arc_points(lat, lon, "nw", 55.0, num_points=7)
+
+    bearings = np.linspace(315.0, 405.0, 7) % 360.0
+    expected = [calculate_destination_point(lat, lon, float(b), 55.0) for b in bearings]
+    assert np.allclose(points, expected)
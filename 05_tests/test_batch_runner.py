@@ -0,0 +1,37 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "02_transformations" / "storm_tract_distance" / "src"))
+sys.path.insert(0, str(REPO_ROOT / "03_integration" / "src"))
+
+import storm_tract_distance
+from batch_runner import DEFAULT_HURDAT_PATH, TRACT_COLUMNS, process_storm
+from feature_io import FINAL_COLUMNS
+from parse_raw_indexed import get_or_build_index
+from tract_centroids import load_tracts_with_centroids
+
+
+def test_process_storm_matches_run_pipeline(tmp_path, monkeypatch):
+    """The batch runner must write the same features as the per-storm pipeline."""
+    monkeypatch.setattr(storm_tract_distance, "ENVELOPE_CACHE_DIR", tmp_path)
+    storm_id, states = "AL142018", ["12"]  # Michael, Florida tracts only
+
+    expected = storm_tract_distance.run_pipeline(SimpleNamespace(
+        storm_id=storm_id,
+        hurdat_path=DEFAULT_HURDAT_PATH,
+        census_year=2019,
+        bounds_margin=3.0,
+        states=states,
+        output=None,
+    ))
+    tract_data = load_tracts_with_centroids(year=2019, columns=TRACT_COLUMNS, states=states)
+    features = process_storm(storm_id, tract_data, DEFAULT_HURDAT_PATH, get_or_build_index(DEFAULT_HURDAT_PATH))
+
+    assert not expected.empty
+    assert {"STATEFP", "COUNTYFP", "storm_time", "storm_tract_id"} <= set(features.columns)
+    pd.testing.assert_frame_equal(features[FINAL_COLUMNS], expected[FINAL_COLUMNS])
+    pd.testing.assert_frame_equal(features[expected.columns], expected)
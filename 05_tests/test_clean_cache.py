@@ -0,0 +1,31 @@
+"""Tests for the cached cleaned-HURDAT2 loader."""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "01_data_sources" / "hurdat2" / "src"))
+
+from clean_cache import load_clean_hurdat2
+from parse_raw import parse_hurdat2_file
+from profile_clean import clean_hurdat2_data
+
+HURDAT_PATH = REPO_ROOT / "01_data_sources" / "hurdat2" / "input_data" / "hurdat2-atlantic.txt"
+
+
+def test_load_clean_hurdat2_round_trips_cache(tmp_path):
+    lines = HURDAT_PATH.read_text().splitlines()
+    start = next(i for i, line in enumerate(lines) if line.startswith("AL092021,"))
+    hurdat_file = tmp_path / "ida.txt"
+    hurdat_file.write_text("\n".join(lines[start:start + 41]) + "\n")
+    cache_dir = tmp_path / "cache"
+
+    built = load_clean_hurdat2(hurdat_file, cache_dir=cache_dir)
+    assert len(list(cache_dir.glob("ida_clean_*.parquet"))) == 1
+    cached = load_clean_hurdat2(hurdat_file, cache_dir=cache_dir)
+
+    expected = clean_hurdat2_data(parse_hurdat2_file(str(hurdat_file)))
+    pd.testing.assert_frame_equal(built, expected)
+    pd.testing.assert_frame_equal(cached, expected)
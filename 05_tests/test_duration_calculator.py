@@ -12,6 +12,7 @@ from duration_calculator import (
     check_centroid_exposure_over_time,
     create_instantaneous_wind_polygon,
     interpolate_track_temporal,
+    prepare_duration_track,
 )
 
 
@@ -79,3 +80,15 @@ def test_duration_for_tract_wrapper():
     assert features["duration_in_envelope_hours"] > 0
     assert features["interpolated_points_count"] > 0
     assert features["duration_source"] in {"timeline", "edge_interpolation"}
+
+
+def test_duration_for_tract_reuses_prepared_track():
+    track = build_simple_track()
+    prepared = prepare_duration_track(track, wind_threshold="64kt", interval_minutes=60)
+
+    for centroid in (Point(-90.5, 25.5), Point(-95.0, 20.0)):
+        expected = calculate_duration_for_tract(centroid, track, wind_threshold="64kt", interval_minutes=60)
+        reused = calculate_duration_for_tract(
+            centroid, track, wind_threshold="64kt", interval_minutes=60, interpolated_track=prepared
+        )
+        assert reused == expected
@@ -12,7 +12,7 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(REPO_ROOT / "02_transformations" / "wind_coverage_envelope" / "src"))
 sys.path.insert(0, str(REPO_ROOT / "01_data_sources" / "hurdat2" / "src"))
 
-from envelope_algorithm import create_storm_envelope, get_wind_extent_points
+from envelope_algorithm import create_storm_envelope, create_storm_envelopes, get_wind_extent_points
 from parse_raw import parse_hurdat2_file
 from profile_clean import clean_hurdat2_data
 
@@ -64,6 +64,12 @@ class TestEnvelopeValidity:
         envelope = ida_64kt_envelope_data["envelope"]
         assert envelope.area > 0, f"Envelope area should be positive, but got {envelope.area}"
 
+    def test_multi_threshold_call_matches_single_threshold(self, ida_track_data, ida_64kt_envelope_data):
+        """create_storm_envelopes returns the same 64kt envelope and track line as the single call."""
+        envelope, track_line, _ = create_storm_envelopes(ida_track_data, wind_thresholds=('50kt', '64kt'))['64kt']
+        assert envelope.equals_exact(ida_64kt_envelope_data["envelope"], 0)
+        assert track_line.equals_exact(ida_64kt_envelope_data["track_line"], 0)
+
 
 class TestTrackContainment:
     """Tests to ensure the storm track is correctly contained within the envelope."""
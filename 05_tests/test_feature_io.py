@@ -0,0 +1,88 @@
+"""Unit tests for per-storm feature file helpers."""
+
+import pandas as pd
+from pathlib import Path
+import sys
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "03_integration" / "src"))
+
+from feature_io import (
+    find_storm_feature_files,
+    load_storm_index,
+    read_storm_features,
+    stream_combined_features,
+    write_storm_index,
+)
+
+COLUMNS = ["storm_name", "tract_geoid", "distance_km"]
+
+
+def test_stream_combined_features_matches_concat(tmp_path):
+    """Streaming storm files gives the same CSV/Parquet as concatenating them."""
+    pd.DataFrame({
+        "tract_geoid": [22071001700, 22071001800],
+        "storm_name": ["IDA", "IDA"],
+        "distance_km": [12.5, 40.0],
+        "unused": [1, 2],
+    }).to_csv(tmp_path / "al092021_features.csv", index=False)
+    pd.DataFrame({
+        "storm_name": ["HARVEY"],
+        "tract_geoid": ["48201100000"],
+        "distance_km": [3.25],
+    }).to_parquet(tmp_path / "al092017_features.parquet", index=False)
+
+    files = find_storm_feature_files(tmp_path)
+    frames = [read_storm_features(path, columns=COLUMNS) for path in files]
+    output_path = tmp_path / "storm_tract_features.csv"
+
+    counts = stream_combined_features(iter(frames), output_path, COLUMNS)
+
+    assert counts.to_dict() == {"HARVEY": 1, "IDA": 2}
+    csv_rows = pd.read_csv(output_path)
+    assert csv_rows.columns.tolist() == COLUMNS
+    assert csv_rows["tract_geoid"].tolist() == [48201100000, 22071001700, 22071001800]
+
+    # Later storms are cast to the first storm's Parquet schema
+    combined = pd.read_parquet(output_path.with_suffix(".parquet"))
+    assert combined["tract_geoid"].tolist() == ["48201100000", "22071001700", "22071001800"]
+    assert combined["distance_km"].tolist() == [3.25, 12.5, 40.0]
+
+
+def test_read_storm_features_keeps_geoid_leading_zero(tmp_path):
+    """A fixed str dtype keeps Alabama's leading-zero GEOIDs when reading CSV."""
+    path = tmp_path / "al032020_features.csv"
+    pd.DataFrame({
+        "storm_name": ["CRISTOBAL"],
+        "tract_geoid": ["01001020100"],
+        "distance_km": [5.0],
+    }).to_csv(path, index=False)
+
+    frame = read_storm_features(path, columns=COLUMNS, dtype={"tract_geoid": str, "distance_km": "float64"})
+
+    assert frame["tract_geoid"].tolist() == ["01001020100"]
+    assert frame["distance_km"].tolist() == [5.0]
+
+
+def test_storm_index_summarises_each_storm_file(tmp_path):
+    """The storm index holds one summary row per file and goes stale when files change."""
+    pd.DataFrame({
+        "storm_id": ["AL092021", "AL092021"],
+        "storm_name": ["IDA", "IDA"],
+        "duration_in_envelope_hours": [3.0, 7.5],
+        "distance_km": [12.5, 40.0],
+    }).to_parquet(tmp_path / "al092021_features.parquet", index=False)
+
+    write_storm_index(tmp_path)
+    index = load_storm_index(tmp_path)
+    assert index[["storm_id", "year", "path", "n_tracts"]].values.tolist() == [
+        ["AL092021", "2021", "al092021_features.parquet", 2]
+    ]
+    assert index.loc[0, "duration_max"] == 7.5
+    assert index.loc[0, "distance_max"] == 40.0
+
+    # A new storm file not in the saved index triggers an in-memory rebuild
+    pd.DataFrame(columns=["storm_id", "storm_name"]).to_csv(tmp_path / "al012020_features.csv", index=False)
+    index = load_storm_index(tmp_path)
+    assert index["storm_id"].tolist() == ["AL012020", "AL092021"]
+    assert index["n_tracts"].tolist() == [0, 2]
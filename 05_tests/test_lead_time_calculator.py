@@ -1,5 +1,6 @@
 """Unit tests for lead time calculator."""
 
+import numpy as np
 import pandas as pd
 import pytest
 from pathlib import Path
@@ -9,8 +10,10 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(REPO_ROOT / "02_transformations" / "lead_time" / "src"))
 
 from lead_time_calculator import (
+    _first_threshold_times,
     find_category_threshold_time,
     calculate_lead_times,
+    calculate_lead_times_for_tracts,
     validate_lead_times,
     CATEGORY_THRESHOLDS,
 )
@@ -69,6 +72,31 @@ class TestFindCategoryThresholdTime:
         # Uses >= so exact match counts
         assert result == pd.Timestamp('2021-08-28 06:00')
 
+    def test_all_thresholds_in_one_pass_match_scalar(self):
+        """The batched lookup agrees with the per-threshold scan, even on unsorted tracks."""
+        track = pd.DataFrame({
+            'date': pd.to_datetime([
+                '2021-08-29 00:00',
+                '2021-08-27 00:00',
+                '2021-08-28 00:00',
+                '2021-08-30 00:00',
+            ]),
+            'max_wind': [120, 70, 100, 115]
+        })
+
+        result = _first_threshold_times(track)
+
+        for category, threshold_kt in CATEGORY_THRESHOLDS.items():
+            assert result[category] == find_category_threshold_time(track, threshold_kt)
+        assert result['cat5'] is None
+
+    def test_empty_track_reaches_no_threshold(self):
+        """An empty track yields None for every threshold instead of raising."""
+        track = pd.DataFrame({'date': pd.to_datetime([]), 'max_wind': []})
+
+        assert _first_threshold_times(track) == {category: None for category in CATEGORY_THRESHOLDS}
+        assert all(value is None for value in calculate_lead_times(track, pd.Timestamp('2021-08-29')).values())
+
 
 class TestCalculateLeadTimes:
     """Test calculating lead times for all categories."""
@@ -169,6 +197,32 @@ class TestCalculateLeadTimes:
         assert lead_times['lead_time_cat5_hours'] is None
 
 
+class TestCalculateLeadTimesForTracts:
+    """Test the vectorised lead time calculation across tracts."""
+
+    def test_matches_scalar_calculation(self):
+        """Each tract matches calculate_lead_times; unreached categories are NaN."""
+        track = pd.DataFrame({
+            'date': pd.to_datetime([
+                '2021-08-27 00:00',
+                '2021-08-28 00:00',
+                '2021-08-29 00:00',
+            ]),
+            'max_wind': [70, 100, 120]
+        })
+        approach_times = pd.to_datetime(['2021-08-29 12:00', '2021-08-27 06:00']).values
+
+        result = calculate_lead_times_for_tracts(track, approach_times)
+
+        for i, approach in enumerate(approach_times):
+            expected = calculate_lead_times(track, pd.Timestamp(approach))
+            for key, value in expected.items():
+                if value is None:
+                    assert np.isnan(result[key][i])
+                else:
+                    assert result[key][i] == pytest.approx(value)
+
+
 class TestValidateLeadTimes:
     """Test lead time validation logic."""
 
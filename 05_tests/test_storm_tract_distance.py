@@ -11,9 +11,16 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(REPO_ROOT / "02_transformations" / "storm_tract_distance" / "src"))
 sys.path.insert(0, str(REPO_ROOT / "02_transformations" / "wind_interpolation" / "src"))
 
+import storm_tract_distance
 from storm_tract_distance import (
+    centroid_to_track_km,
     compute_min_distance_features,
+    create_wind_coverage_envelope,
     haversine_nm,
+    load_wind_coverage_envelope,
+    nearest_track_points,
+    quadrant_for_offset,
+    quadrants_for_offsets,
 )
 from wind_interpolation import calculate_max_wind_experienced
 
@@ -40,6 +47,80 @@ def test_haversine_nm_basic_symmetry():
     assert np.allclose(a, b)
 
 
+def test_nearest_track_points_matches_per_tract_loop():
+    tract_lats = np.array([29.0, 30.2, 31.5])
+    tract_lons = np.array([-91.0, -89.7, -90.4])
+    track_lats = np.array([28.5, 29.5, 30.5, 31.5])
+    track_lons = np.array([-90.0, -90.2, -90.1, -89.8])
+
+    min_idx, min_dist = nearest_track_points(tract_lats, tract_lons, track_lats, track_lons)
+
+    for i, (lat, lon) in enumerate(zip(tract_lats, tract_lons)):
+        dists = haversine_nm(np.full(4, lat), np.full(4, lon), track_lats, track_lons)
+        assert min_idx[i] == np.argmin(dists)
+        assert np.isclose(min_dist[i], dists.min())
+
+
+def test_centroid_to_track_km_matches_haversine():
+    points = gpd.GeoSeries([Point(-90.0, 30.0), Point(-90.0, 29.0)], crs="EPSG:4326")
+    track_line = LineString([(-90.5, 28.0), (-90.5, 31.0)])
+
+    distances = centroid_to_track_km(points, track_line)
+
+    expected_km = haversine_nm(np.array([30.0, 29.0]), np.full(2, -90.0), np.array([30.0, 29.0]), np.full(2, -90.5)) * 1.852
+    assert np.allclose(distances.to_numpy(), expected_km, rtol=0.01)
+
+
+def test_load_wind_coverage_envelope_round_trips_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(storm_tract_distance, "ENVELOPE_CACHE_DIR", tmp_path)
+    track = make_track(
+        date=pd.to_datetime([dt.datetime(2021, 8, 28, 0), dt.datetime(2021, 8, 28, 6)]),
+        lat=[29.0, 29.5],
+        lon=[-90.0, -90.5],
+        wind_radii_64_ne=[40.0, 50.0],
+        wind_radii_64_se=[40.0, 50.0],
+        wind_radii_64_sw=[30.0, 40.0],
+        wind_radii_64_nw=[30.0, 40.0],
+    )
+
+    built, _ = load_wind_coverage_envelope(track, "AL999999")
+    assert len(list(tmp_path.glob("AL999999_64kt_15min_*.wkb"))) == 1
+    cached, track_line = load_wind_coverage_envelope(track, "AL999999")
+
+    expected, expected_line, _ = create_wind_coverage_envelope(track)
+    assert cached.equals(expected) and built.equals(expected)
+    assert track_line.equals(expected_line)
+
+
+def test_load_wind_coverage_envelope_rebuild_replaces_cache_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(storm_tract_distance, "ENVELOPE_CACHE_DIR", tmp_path)
+    track = make_track(
+        date=pd.to_datetime([dt.datetime(2021, 8, 28, 0), dt.datetime(2021, 8, 28, 6)]),
+        lat=[29.0, 29.5],
+        lon=[-90.0, -90.5],
+        wind_radii_64_ne=[40.0, 50.0],
+        wind_radii_64_se=[40.0, 50.0],
+        wind_radii_64_sw=[30.0, 40.0],
+        wind_radii_64_nw=[30.0, 40.0],
+    )
+    load_wind_coverage_envelope(track, "AL999999")
+    (cache_file,) = tmp_path.glob("AL999999_64kt_15min_*.wkb")
+    cache_file.write_bytes(cache_file.read_bytes()[:10])  # e.g. left by an interrupted writer
+
+    rebuilt, _ = load_wind_coverage_envelope(track, "AL999999", force_rebuild=True)
+    cached, _ = load_wind_coverage_envelope(track, "AL999999")
+
+    assert cached.equals(rebuilt)
+    assert [path.name for path in tmp_path.iterdir()] == [cache_file.name]
+
+
+def test_quadrants_for_offsets_matches_scalar():
+    lat_diff = np.array([1.0, -1.0, -1.0, 1.0, 0.0])
+    lon_diff = np.array([1.0, 1.0, -1.0, -1.0, 0.0])
+    expected = [quadrant_for_offset(a, b) for a, b in zip(lat_diff, lon_diff)]
+    assert list(quadrants_for_offsets(lat_diff, lon_diff)) == expected
+
+
 def test_compute_min_distance_features_structure():
     track = make_track()
     centroids = gpd.GeoDataFrame(
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 import sys
 from dataclasses import dataclass
 from pathlib import Path
@@ -10,9 +11,12 @@ from typing import Dict, List, Optional, Tuple
 
 import folium
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 import plotly.express as px
+import shapely
 import streamlit as st
+import streamlit.components.v1 as components
 from branca.colormap import linear
 from shapely.geometry import LineString, Polygon
 from streamlit_folium import st_folium
@@ -21,6 +25,32 @@ from streamlit_folium import st_folium
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = REPO_ROOT / "07_dashboard_app" / "data"
 TARGET_HURRICANES_PATH = REPO_ROOT / "00_config" / "target_hurricanes.json"
+COLOR_LUT_SIZE = 256
+MAP_HEIGHT = 500
+
+# Columns shown in tract popups; the remaining columns (geometry, ids, QA
+# fields) stay in the feature table
+POPUP_COLUMNS = [
+    "tract_geoid",
+    "STATEFP",
+    "COUNTYFP",
+    "storm_name",
+    "storm_time",
+    "distance_km",
+    "nearest_quadrant",
+    "max_wind_experienced_kt",
+    "center_wind_at_approach_kt",
+    "inside_eyewall",
+    "first_entry_time",
+    "last_exit_time",
+    "duration_in_envelope_hours",
+    "exposure_window_hours",
+    "lead_time_cat1_hours",
+    "lead_time_cat2_hours",
+    "lead_time_cat3_hours",
+    "lead_time_cat4_hours",
+    "lead_time_cat5_hours",
+]
 
 
 # --- Data Loading ---
@@ -44,11 +74,15 @@ def discover_storms() -> List[StormOption]:
     """Return available storms based on the pre-computed GeoJSON files."""
     options: List[StormOption] = []
     storm_meta = get_storm_metadata()
-    if not DATA_DIR.exists():
+    # One directory listing; storm ids come straight from the entry names
+    try:
+        with os.scandir(DATA_DIR) as entries:
+            names = sorted(entry.name for entry in entries if entry.name.endswith(".geojson"))
+    except FileNotFoundError:
         return options
 
-    for geojson_path in sorted(DATA_DIR.glob("*.geojson")):
-        storm_id = geojson_path.stem
+    for name in names:
+        storm_id = name[: -len(".geojson")]
         if storm_id in storm_meta:
             meta = storm_meta[storm_id]
             label = f"{meta['name'].title()} ({storm_id}) – {meta['year']}"
@@ -60,52 +94,108 @@ def discover_storms() -> List[StormOption]:
 
     return options
 
-@st.cache_data(show_spinner=False)
-def load_storm_data(storm_id: str) -> Tuple[Optional[Polygon], Optional[LineString], Optional[gpd.GeoDataFrame]]:
-    """Load and parse a pre-computed GeoJSON data file for a single storm."""
+def _read_storm_frame(storm_id: str) -> Optional[gpd.GeoDataFrame]:
+    """Read a storm's pre-computed layers, preferring the GeoParquet copy.
+
+    ``precompute_dashboard_data.py`` writes ``{storm_id}.parquet`` next to the
+    GeoJSON. When that copy is missing or older than the GeoJSON, the GeoJSON
+    is parsed once and the Parquet copy written so later loads skip it.
+    """
     geojson_path = DATA_DIR / f"{storm_id}.geojson"
+    parquet_path = geojson_path.with_suffix(".parquet")
+    if parquet_path.exists() and (
+        not geojson_path.exists() or parquet_path.stat().st_mtime >= geojson_path.stat().st_mtime
+    ):
+        return gpd.read_parquet(parquet_path)
     if not geojson_path.exists():
-        return None, None, None
+        return None
 
-    gdf = gpd.read_file(geojson_path)
+    try:
+        # pyogrio reads the whole layer in one GDAL call into Arrow buffers
+        gdf = gpd.read_file(geojson_path, engine="pyogrio", use_arrow=True)
+    except ImportError:
+        gdf = gpd.read_file(geojson_path, engine="fiona")
+    try:
+        gdf.to_parquet(parquet_path, index=False)
+    except OSError:
+        pass  # Read-only deployments just keep parsing the GeoJSON
+    return gdf
+
+
+@st.cache_resource(show_spinner=False)
+def load_storm_data(storm_id: str) -> Tuple[Optional[Polygon], Optional[LineString], Optional[gpd.GeoDataFrame]]:
+    """Load and parse a pre-computed data file for a single storm.
+
+    Cached as a resource, so reruns share the same objects instead of
+    unpickling copies; callers must not modify them in place.
+    """
+    gdf = _read_storm_frame(storm_id)
+    if gdf is None:
+        return None, None, None
 
     # Extract the different geometry types
     envelope_geom = gdf[gdf["type"] == "envelope"].geometry.iloc[0]
+    # Prepared once per storm; the resource cache keeps this exact object, so
+    # every rerun's containment checks reuse the envelope's edge index
+    shapely.prepare(envelope_geom)
     track_geom = gdf[gdf["type"] == "track"].geometry.iloc[0]
     tracts_gdf = gdf[gdf["type"] == "tract"].copy()
 
-    # Ensure datetime columns are parsed
-    for col in ["storm_time", "first_entry_time", "last_exit_time"]:
-        if col in tracts_gdf.columns:
-            tracts_gdf[col] = pd.to_datetime(tracts_gdf[col], errors="coerce")
+    # Ensure datetime columns are parsed; the GeoJSON/GeoParquet readers usually
+    # return them typed already, and any left as text are ISO 8601 strings
+    date_cols = [
+        col for col in ("storm_time", "first_entry_time", "last_exit_time")
+        if col in tracts_gdf.columns and not pd.api.types.is_datetime64_any_dtype(tracts_gdf[col])
+    ]
+    if date_cols:
+        tracts_gdf[date_cols] = tracts_gdf[date_cols].apply(pd.to_datetime, errors="coerce", format="ISO8601")
 
     return envelope_geom, track_geom, tracts_gdf
 
 
+@st.cache_resource(show_spinner=False)
+def load_envelope_geojson(storm_id: str) -> Optional[str]:
+    """Serialise a storm's wind-coverage envelope to a GeoJSON string once per storm."""
+    envelope, _, _ = load_storm_data(storm_id)
+    return None if envelope is None else shapely.to_geojson(envelope)
+
+
 def summarise_features(df: pd.DataFrame) -> Dict[str, str]:
     """Compute key statistics for metric cards."""
 
     summary: Dict[str, str] = {
         "Affected Tracts": f"{len(df):,}",
     }
-    if "duration_in_envelope_hours" in df.columns and not df.empty:
-        durations = df["duration_in_envelope_hours"].dropna()
-        summary["Duration Range"] = (
-            f"{durations.min():.1f} – {durations.max():.1f} hrs" if not durations.empty else "N/A"
-        )
-        summary["Mean Duration"] = f"{durations.mean():.1f} hrs" if not durations.empty else "N/A"
-    if "distance_km" in df.columns and not df.empty:
-        distances = df["distance_km"].dropna()
-        summary["Distance Range"] = (
-            f"{distances.min():.1f} – {distances.max():.1f} km" if not distances.empty else "N/A"
-        )
-    if "max_wind_experienced_kt" in df.columns and not df.empty:
-        summary["Max Wind"] = f'{df['max_wind_experienced_kt'].max():.0f} kt'
-    if "storm_time" in df.columns and not df.empty:
-        storm_times = df["storm_time"].dropna().sort_values()
-        if not storm_times.empty:
-            summary["First Observation"] = storm_times.iloc[0].strftime("%Y-%m-%d %H:%M")
-            summary["Last Observation"] = storm_times.iloc[-1].strftime("%Y-%m-%d %H:%M")
+    if df.empty:
+        return summary
+
+    # Resolve every metric in one aggregation pass; min/max/mean skip missing values
+    agg_spec = {
+        col: funcs
+        for col, funcs in {
+            "duration_in_envelope_hours": ["min", "max", "mean"],
+            "distance_km": ["min", "max"],
+            "max_wind_experienced_kt": ["max"],
+            "storm_time": ["min", "max"],
+        }.items()
+        if col in df.columns
+    }
+    stats = df.agg(agg_spec) if agg_spec else pd.DataFrame()
+
+    if "duration_in_envelope_hours" in stats:
+        low, high, mean = stats["duration_in_envelope_hours"].loc[["min", "max", "mean"]]
+        summary["Duration Range"] = f"{low:.1f} – {high:.1f} hrs" if not pd.isna(low) else "N/A"
+        summary["Mean Duration"] = f"{mean:.1f} hrs" if not pd.isna(mean) else "N/A"
+    if "distance_km" in stats:
+        low, high = stats["distance_km"].loc[["min", "max"]]
+        summary["Distance Range"] = f"{low:.1f} – {high:.1f} km" if not pd.isna(low) else "N/A"
+    if "max_wind_experienced_kt" in stats:
+        summary["Max Wind"] = f"{stats.at['max', 'max_wind_experienced_kt']:.0f} kt"
+    if "storm_time" in stats:
+        first, last = stats["storm_time"].loc[["min", "max"]]
+        if not pd.isna(first):
+            summary["First Observation"] = first.strftime("%Y-%m-%d %H:%M")
+            summary["Last Observation"] = last.strftime("%Y-%m-%d %H:%M")
     return summary
 
 
@@ -113,27 +203,122 @@ def apply_filters(
     df: pd.DataFrame,
     min_duration: float,
     max_distance: float,
+    envelope: Optional[Polygon] = None,
 ) -> pd.DataFrame:
-    """Filter feature dataframe based on user controls."""
+    """Filter feature dataframe based on user controls.
+
+    When ``envelope`` is given, tracts whose centroid falls outside it are dropped.
+    """
+
+    # Fuse every condition into one mask so only the final selection is materialised;
+    # the source index is kept because no consumer needs a RangeIndex
+    mask = np.ones(len(df), dtype=bool)
+    if "duration_in_envelope_hours" in df.columns:
+        mask &= df["duration_in_envelope_hours"].to_numpy(dtype=float) >= min_duration
+    if "distance_km" in df.columns:
+        mask &= df["distance_km"].to_numpy(dtype=float) <= max_distance
+    if envelope is not None:
+        points = shapely.points(df["centroid_lon"].to_numpy(), df["centroid_lat"].to_numpy())
+        mask &= shapely.intersects(envelope, points)
+    return df.loc[mask]
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def filter_storm_features(
+    storm_id: str, min_duration: float, max_distance: float, clip_to_envelope: bool
+) -> pd.DataFrame:
+    """Cached :func:`apply_filters` over a storm's tracts, keyed on the control values."""
+    envelope, _, features_df = load_storm_data(storm_id)
+    return apply_filters(features_df, min_duration, max_distance, envelope if clip_to_envelope else None)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def summarise_storm_features(
+    storm_id: str, min_duration: float, max_distance: float, clip_to_envelope: bool
+) -> Dict[str, str]:
+    """Cached :func:`summarise_features` for the same filter key as :func:`filter_storm_features`."""
+    return summarise_features(filter_storm_features(storm_id, min_duration, max_distance, clip_to_envelope))
+
+
+def _colormap_hex(colormap, values: np.ndarray) -> np.ndarray:
+    """Vectorised ``colormap(value)`` via a sampled lookup table; NaN maps to grey.
+
+    The colormap is evaluated once at ``COLOR_LUT_SIZE`` evenly spaced stops and
+    each value is bucketed into the nearest stop.
+    """
+
+    vmin, vmax = colormap.vmin, colormap.vmax
+    lut = np.array([colormap(stop) for stop in np.linspace(vmin, vmax, COLOR_LUT_SIZE)], dtype=object)
+    span = vmax - vmin
+    scaled = (np.nan_to_num(values, nan=vmin) - vmin) / span if span > 0 else np.zeros(len(values))
+    buckets = np.clip(np.rint(scaled * (COLOR_LUT_SIZE - 1)), 0, COLOR_LUT_SIZE - 1).astype(int)
+    colors = lut[buckets]
+    colors[np.isnan(values)] = "#cccccc"
+    return colors
+
+
+def _centroid_tooltips(df: pd.DataFrame, selected_feature: str) -> pd.Series:
+    """Build every centroid's tooltip HTML with column-wise string operations."""
+
+    def fmt(col: str) -> np.ndarray:
+        values = df[col].to_numpy(dtype=float) if col in df else np.full(len(df), np.nan)
+        return np.char.mod("%.1f", values).astype(object)
+
+    geoids = df["tract_geoid"].astype(str) if "tract_geoid" in df else pd.Series("None", index=df.index)
+    return (
+        "<b>Tract:</b> " + geoids + "<br>"
+        + f"<b>{selected_feature.replace('_', ' ').title()}:</b> " + fmt(selected_feature) + "<br><hr>"
+        + "<b>Distance:</b> " + fmt("distance_km") + " km<br>"
+        + "<b>Duration:</b> " + fmt("duration_in_envelope_hours") + " hrs<br>"
+        + "<b>Max Wind:</b> " + fmt("max_wind_experienced_kt") + " kt"
+    )
 
-    filtered = df.copy()
-    if "duration_in_envelope_hours" in filtered.columns:
-        filtered = filtered[filtered["duration_in_envelope_hours"] >= min_duration]
-    if "distance_km" in filtered.columns:
-        filtered = filtered[filtered["distance_km"] <= max_distance]
-    return filtered.reset_index(drop=True)
+
+def _centroid_popups(df: pd.DataFrame) -> pd.Series:
+    """Build popup HTML from the ``POPUP_COLUMNS`` present, skipping missing values."""
+
+    # Every non-missing field starts with "<br>", so the leading one is sliced off
+    popups = pd.Series("", index=df.index)
+    for col in [col for col in POPUP_COLUMNS if col in df.columns]:
+        values = df[col]
+        popups += ("<br><b>" + col + ":</b> " + values.astype(str)).where(values.notna(), "")
+    return popups.str[len("<br>"):]
+
+
+def _centroid_feature_collection(df: pd.DataFrame, selected_feature: str, colormap) -> Dict[str, object]:
+    """Build a GeoJSON FeatureCollection of tract centroids with colour, tooltip and popup HTML."""
+
+    colors = _colormap_hex(colormap, df[selected_feature].to_numpy(dtype=float))
+    coordinates = zip(df["centroid_lon"].to_numpy(dtype=float), df["centroid_lat"].to_numpy(dtype=float))
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [lon, lat]},
+                "properties": {"color": color, "tooltip": tooltip, "popup": popup},
+            }
+            for (lon, lat), color, tooltip, popup in zip(
+                coordinates, colors, _centroid_tooltips(df, selected_feature), _centroid_popups(df)
+            )
+        ],
+    }
 
 
 def build_map(
     df: pd.DataFrame,
-    coverage: Polygon,
+    coverage: Optional[str],
     track_line: Optional[LineString],
     selected_feature: str,
     show_envelope: bool,
     show_track: bool,
     show_centroids: bool,
 ) -> Optional[folium.Map]:
-    """Construct folium map for the filtered dataset."""
+    """Construct folium map for the filtered dataset.
+
+    ``coverage`` is the envelope as a GeoJSON string from
+    :func:`load_envelope_geojson`.
+    """
 
     if df.empty:
         return None
@@ -164,8 +349,6 @@ def build_map(
         ).add_to(fmap)
 
     if show_centroids and selected_feature in df:
-        centroid_layer = folium.FeatureGroup(name="Tract Centroids", show=True)
-        
         feature_values = df[selected_feature].dropna()
         if feature_values.empty:
             feature_values = pd.Series([0])
@@ -175,36 +358,51 @@ def build_map(
         colormap.caption = f"{selected_feature.replace('_', ' ').title()}"
         colormap.add_to(fmap)
 
-        for _, row in df.iterrows():
-            feature_value = row.get(selected_feature)
-            color = colormap(feature_value) if pd.notna(feature_value) else "#cccccc"
-            
-            # Create a dynamic tooltip
-            tooltip_html = f"<b>Tract:</b> {row.get('tract_geoid')}<br>"
-            tooltip_html += f"<b>{selected_feature.replace('_', ' ').title()}:</b> {feature_value:.1f}<br><hr>"
-            tooltip_html += f"<b>Distance:</b> {row.get('distance_km', float('nan')):.1f} km<br>"
-            tooltip_html += f"<b>Duration:</b> {row.get('duration_in_envelope_hours', float('nan')):.1f} hrs<br>"
-            tooltip_html += f"<b>Max Wind:</b> {row.get('max_wind_experienced_kt', float('nan')):.1f} kt"
-
-            popup_fields = row.dropna()
-            popup_html = "<br>".join(f"<b>{col}:</b> {val}" for col, val in popup_fields.items())
-
-            folium.CircleMarker(
-                location=[row["centroid_lat"], row["centroid_lon"]],
-                radius=4,
-                color=color,
-                fill=True,
-                fill_color=color,
-                fill_opacity=0.8,
-                tooltip=tooltip_html,
-                popup=folium.Popup(popup_html, max_width=300),
-            ).add_to(centroid_layer)
-        centroid_layer.add_to(fmap)
+        # One GeoJson layer for all tracts: folium renders a single template
+        # instead of one CircleMarker per row
+        folium.GeoJson(
+            _centroid_feature_collection(df, selected_feature, colormap),
+            name="Tract Centroids",
+            show=True,
+            marker=folium.CircleMarker(radius=4, fill=True, fill_opacity=0.8),
+            style_function=lambda feature: {
+                "color": feature["properties"]["color"],
+                "fillColor": feature["properties"]["color"],
+            },
+            tooltip=folium.GeoJsonTooltip(fields=["tooltip"], labels=False),
+            popup=folium.GeoJsonPopup(fields=["popup"], labels=False, max_width=300),
+        ).add_to(fmap)
 
     folium.LayerControl().add_to(fmap)
     return fmap
 
 
+@st.cache_data(show_spinner=False, max_entries=16)
+def render_map_html(
+    storm_id: str,
+    filter_key: Tuple[float, float],
+    selected_feature: str,
+    layers: Tuple[bool, bool, bool],
+) -> Optional[str]:
+    """Return the rendered HTML of :func:`build_map` for one storm, filter and layer set.
+
+    ``filter_key`` is ``(min_duration, max_distance)`` and ``layers`` is
+    ``(show_envelope, show_track, show_centroids)``.
+    """
+    _, track, _ = load_storm_data(storm_id)
+    show_envelope, show_track, show_centroids = layers
+    fmap = build_map(
+        filter_storm_features(storm_id, *filter_key, show_envelope),
+        coverage=load_envelope_geojson(storm_id),
+        track_line=track,
+        selected_feature=selected_feature,
+        show_envelope=show_envelope,
+        show_track=show_track,
+        show_centroids=show_centroids,
+    )
+    return None if fmap is None else fmap.get_root().render()
+
+
 def render_charts(df: pd.DataFrame, storm_label: str, selected_feature: str) -> None:
     """Render dynamic charts based on the selected feature."""
 
@@ -269,7 +467,7 @@ def main() -> None:
     selected_option = next(opt for opt in storm_options if opt.label == selected_label)
 
     # --- Load Data ---
-    envelope, track, features_df = load_storm_data(selected_option.storm_id)
+    _, track, features_df = load_storm_data(selected_option.storm_id)
     if features_df is None:
         st.error(f"Could not load data for {selected_option.label}. Check the logs.")
         return
@@ -307,11 +505,17 @@ def main() -> None:
     show_envelope = st.sidebar.checkbox("Wind Coverage", value=True)
     show_track = st.sidebar.checkbox("Storm Track", value=True)
     show_centroids = st.sidebar.checkbox("Tract Centroids", value=True)
+    interactive_map = st.sidebar.checkbox(
+        "Live map (streamlit-folium)",
+        value=False,
+        help="Rebuild the map through streamlit-folium on every change instead of reusing cached HTML.",
+    )
 
     # --- Main Page --- 
-    filtered_df = apply_filters(features_df, min_duration, max_distance)
+    filter_key = (selected_option.storm_id, min_duration, max_distance, show_envelope)
+    filtered_df = filter_storm_features(*filter_key)
 
-    summary = summarise_features(filtered_df)
+    summary = summarise_storm_features(*filter_key)
     summary_cols = st.columns(min(4, len(summary))) if summary else []
     for (label, value), col in zip(summary.items(), summary_cols):
         col.metric(label, value)
@@ -328,25 +532,37 @@ def main() -> None:
     map_container = st.container()
     with map_container:
         st.subheader("Interactive Map")
-        fmap = build_map(
-            filtered_df,
-            coverage=envelope,
-            track_line=track,
-            selected_feature=selected_feature,
-            show_envelope=show_envelope,
-            show_track=show_track,
-            show_centroids=show_centroids,
-        )
-        if fmap is None:
-            st.info("Insufficient data to render the map with current filters.")
+        if interactive_map:
+            fmap = build_map(
+                filtered_df,
+                coverage=load_envelope_geojson(selected_option.storm_id),
+                track_line=track,
+                selected_feature=selected_feature,
+                show_envelope=show_envelope,
+                show_track=show_track,
+                show_centroids=show_centroids,
+            )
+            map_html = None
+        else:
+            fmap = None
+            map_html = render_map_html(
+                selected_option.storm_id,
+                (min_duration, max_distance),
+                selected_feature,
+                (show_envelope, show_track, show_centroids),
+            )
+        if fmap is not None:
+            st_folium(fmap, width=None, height=MAP_HEIGHT, returned_objects=[], key=f"map-{selected_option.storm_id}")
+        elif map_html is not None:
+            components.html(map_html, height=MAP_HEIGHT)
         else:
-            st_folium(fmap, width=None, height=500, returned_objects=[], key=f"map-{selected_option.storm_id}")
+            st.info("Insufficient data to render the map with current filters.")
 
     st.subheader("Analytical Views")
     render_charts(filtered_df, storm_label=selected_option.label, selected_feature=selected_feature)
 
     st.subheader("Feature Table")
-    st.dataframe(filtered_df, use_container_width=True, hide_index=True)
+    st.dataframe(pd.DataFrame(filtered_df.drop(columns="geometry", errors="ignore")), use_container_width=True, hide_index=True)
 
 
 if __name__ == "__main__":